@@ -9,12 +9,17 @@ direct storage, and file-based backups.
 # pylint: disable=too-many-lines
 
 import gzip
+import os
 import tarfile
+import threading
 import time
-import traceback
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
+from stat import S_ISREG
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypedDict, Union
 
 import requests
 
@@ -25,6 +30,10 @@ from plugins.base import HypervisorPlugin, ServicePlugin
 from plugins.hypervisors.proxmox import ProxmoxPlugin
 from plugins.services.generic import GenericServicePlugin
 
+# Characters in service names that are not safe in backup filenames
+# (path separators, spaces, and ':' which SMB/CIFS backup shares reject)
+_SAFE_NAME_TRANS = str.maketrans(dict.fromkeys(" /\\:", "_"))
+
 
 class BackupError(Exception):
     """
@@ -35,6 +44,23 @@ class BackupError(Exception):
     """
 
 
+class BackupDestination(TypedDict, total=False):
+    """
+    Backup destination returned by BackupEngine._determine_backup_destination().
+
+    A plain dict at runtime; this only documents the keys for type checkers.
+
+    Attributes:
+        method: 'pbs' | 'direct' | 'local'
+        path: Backup location (direct/local only)
+        pbs_config: PBS configuration (pbs only)
+    """
+
+    method: str
+    path: Path
+    pbs_config: Dict[str, Any]
+
+
 class BackupEngine:
     """
     Orchestrates backup operations across all services.
@@ -51,6 +77,42 @@ class BackupEngine:
         logger: Logger instance
     """
 
+    # PBS settings that must be present when PBS is enabled
+    PBS_REQUIRED_FIELDS = ("server", "datastore", "username")
+
+    # Successful PBS connectivity checks are reused for this many seconds
+    PBS_PROBE_TTL_SECONDS = 300
+
+    # Duration reported for simulated (dry-run) backups
+    DRY_RUN_DURATION_SECONDS = 0.1
+
+    # Connection pool sizing for the shared PBS HTTP session
+    PBS_POOL_CONNECTIONS = 4
+    PBS_POOL_MAXSIZE = 16
+
+    # Service types handled by hypervisor plugins vs service plugins
+    HYPERVISOR_TYPES = frozenset({"vm", "lxc"})
+    SERVICE_TYPES = frozenset({"docker", "systemd", "generic"})
+    SUPPORTED_TYPES = ("vm", "lxc", "docker", "systemd", "generic")
+
+    # Sortable, filesystem-safe timestamp embedded in backup filenames
+    FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+    # How long a "never backed up" answer from get_last_backup_time() is reused
+    LAST_BACKUP_NEGATIVE_TTL_SECONDS = 5.0
+
+    # Newest backups always kept by retention, regardless of age
+    MIN_BACKUPS_TO_KEEP = 1
+
+    # Upper bound on concurrent checks in verify_backups()
+    MAX_PARALLEL_VERIFICATIONS = 8
+
+    # Read size used when deep verification decompresses a whole archive
+    VERIFY_READ_CHUNK_BYTES = 1024 * 1024
+
+    # Path prefixes treated as cluster-shared storage for direct backups
+    SHARED_STORAGE_PREFIXES = ("/mnt", "/nfs", "/ceph")
+
     def __init__(
         self,
         config_loader: ConfigLoader,
@@ -78,7 +140,32 @@ class BackupEngine:
         self.dry_run = dry_run
         self.logger = get_logger()
         self._plugin_cache: Dict[str, Union[HypervisorPlugin, ServicePlugin]] = {}
+        self._plugin_instances: Dict[type, Union[HypervisorPlugin, ServicePlugin]] = {}
         self._backup_config_cache: Optional[Dict[str, Any]] = None
+        self._pbs_probe_cache: Dict[Tuple[str, int], float] = {}
+        self._validated_pbs_config: Optional[Dict[str, Any]] = None
+        self._ensured_dirs: set[Path] = set()
+        self._backup_dir_cache: Dict[str, Path] = {}
+        self._run_timestamp: Optional[str] = None
+        self._missing_backup_expiry: Dict[str, float] = {}
+        self._pbs_session: Optional[requests.Session] = None
+        self._pbs_probe_lock = threading.Lock()
+        self._plugin_lock = threading.Lock()
+        self._backup_executors: Dict[
+            str,
+            Callable[
+                [
+                    Union[HypervisorPlugin, ServicePlugin],
+                    ServiceConfig,
+                    BackupDestination,
+                ],
+                Tuple[bool, Optional[Path], Optional[str]],
+            ],
+        ] = {
+            "pbs": self._run_pbs_backup,
+            "direct": self._run_direct_backup,
+            "local": self._run_local_backup,
+        }
 
         # Validate backup configuration on initialization (fail fast)
         self._validate_backup_config()
@@ -145,6 +232,10 @@ class BackupEngine:
         that has backup enabled. Aggregates results and sends summary notification.
         Continues with remaining services even if individual backups fail.
 
+        Services are backed up sequentially by default. When
+        global.backup.max_parallel is greater than 1, up to that many backups
+        run concurrently in a bounded thread pool.
+
         Returns:
             Dict mapping service_name -> success status
             Example: {"nextcloud": True, "adguard": False, "plex": True}
@@ -158,7 +249,7 @@ class BackupEngine:
             >>> print(f"Backed up {sum(results.values())} services successfully")
         """
         # Track start time for total duration
-        start_time = time.time()
+        start_time = time.monotonic()
         results = {}
 
         # Get all services and filter to backup-enabled
@@ -172,20 +263,23 @@ class BackupEngine:
 
         self.logger.info(f"Starting backup for {len(backup_services)} service(s)")
 
-        # Backup each service
-        for service in backup_services:
-            try:
-                success = self.backup_service(service.name)
-                results[service.name] = success
-            except Exception as e:
-                # Don't let one service failure stop others
-                self.logger.error(
-                    f"Unexpected error backing up {service.name}: {e}", exc_info=True
+        # Backup each service, overlapping I/O-bound work when configured.
+        # All backup filenames in this run share one timestamp.
+        service_names = [service.name for service in backup_services]
+        max_parallel = self._get_max_parallel()
+        self._run_timestamp = datetime.now().strftime(self.FILENAME_TIMESTAMP_FORMAT)
+        try:
+            if max_parallel > 1 and len(service_names) > 1:
+                results = self._backup_services_concurrently(
+                    service_names, max_parallel
                 )
-                results[service.name] = False
+            else:
+                results = self._backup_services_sequentially(service_names)
+        finally:
+            self._run_timestamp = None
 
         # Calculate total duration
-        total_duration = time.time() - start_time
+        total_duration = time.monotonic() - start_time
 
         # Send summary notification
         try:
@@ -204,6 +298,126 @@ class BackupEngine:
 
         return results
 
+    def _backup_services_concurrently(
+        self, service_names: list[str], max_parallel: int
+    ) -> Dict[str, bool]:
+        """
+        Back up several services concurrently in a bounded thread pool.
+
+        Backups are I/O-bound (vzdump, PBS API, disk writes), so worker
+        threads let them overlap instead of running back-to-back. Unlike
+        asyncio.run(), this also works when called from a running event loop.
+
+        Args:
+            service_names: Names of services to back up, in configuration order
+            max_parallel: Maximum number of backups running at the same time
+
+        Returns:
+            Dict mapping service_name -> success status, in input order
+        """
+        outcomes: Dict[str, bool] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_parallel, thread_name_prefix="backup"
+        ) as executor:
+            futures = {
+                executor.submit(self._backup_service_safely, name): name
+                for name in service_names
+            }
+            for future in as_completed(futures):
+                # _backup_service_safely() never raises
+                outcomes[futures[future]] = future.result() is True
+
+        return {name: outcomes[name] for name in service_names}
+
+    def _backup_services_sequentially(
+        self, service_names: list[str]
+    ) -> Dict[str, bool]:
+        """
+        Back up services one at a time, preparing the next one in the background.
+
+        While service N's backup blocks on vzdump/PBS/disk I/O, a helper
+        thread warms the plugin and PBS connectivity caches for service N+1
+        (see _prefetch_service()), so its setup doesn't add to the run time.
+
+        Args:
+            service_names: Names of services to back up, in configuration order
+
+        Returns:
+            Dict mapping service_name -> success status, in input order
+        """
+        results = {}
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="backup-prefetch"
+        ) as prefetcher:
+            for index, service_name in enumerate(service_names):
+                if not self.dry_run and index + 1 < len(service_names):
+                    prefetcher.submit(self._prefetch_service, service_names[index + 1])
+                results[service_name] = self._backup_service_safely(service_name)
+        return results
+
+    def _prefetch_service(self, service_name: str) -> None:
+        """
+        Warm caches needed by an upcoming backup (best effort).
+
+        Resolves the service's plugin and, for VMs/LXCs with PBS enabled,
+        runs the cached PBS connectivity probe. Errors are only logged at
+        debug level; backup_service() repeats these steps and reports them.
+
+        Args:
+            service_name: Name of the service that will be backed up next
+        """
+        try:
+            service = self.config.get_service_config(service_name)
+            if service is None or not service.backup:
+                return
+
+            self._get_plugin_for_service(service)
+
+            pbs_config = self._get_backup_config().get("proxmox_backup_server")
+            if (
+                service.type.lower() in self.HYPERVISOR_TYPES
+                and pbs_config
+                and pbs_config.get("enabled")
+            ):
+                self._check_pbs_connectivity(
+                    pbs_config["server"],
+                    pbs_config.get("port", 8007),
+                    pbs_config.get("verify_ssl", True),
+                )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.debug("Prefetch for '{}' skipped: {}", service_name, e)
+
+    def _backup_service_safely(self, service_name: str) -> bool:
+        """
+        Back up a single service, converting unexpected errors into failure.
+
+        Args:
+            service_name: Name of the service to backup
+
+        Returns:
+            True if backup succeeded, False otherwise
+        """
+        try:
+            return self.backup_service(service_name)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Don't let one service failure stop others
+            self.logger.error(
+                f"Unexpected error backing up {service_name}: {e}", exc_info=True
+            )
+            return False
+
+    def _get_max_parallel(self) -> int:
+        """
+        Get the maximum number of concurrent service backups.
+
+        Returns:
+            Value of global.backup.max_parallel, or 1 (sequential) if unset
+        """
+        max_parallel = self.config.get("global.backup.max_parallel", 1)
+        if not isinstance(max_parallel, int) or max_parallel < 1:
+            return 1
+        return max_parallel
+
     def backup_service(self, service_name: str) -> bool:
         """
         Orchestrate backup operation for a single service.
@@ -248,7 +462,7 @@ class BackupEngine:
         self.logger.info(f"Starting backup for {service_name}")
 
         # Track start time for duration
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Get service configuration
@@ -268,7 +482,7 @@ class BackupEngine:
                 self.logger.info(
                     f"[DRY RUN] Would backup {service_name} ({service.type})"
                 )
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 self._update_backup_state(
                     service_name,
                     success=True,
@@ -298,7 +512,7 @@ class BackupEngine:
 
             if not result.get("success", False):
                 # Backup command failed
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 error_message = result.get("error_message", "Backup command failed")
                 self._update_backup_state(
                     service_name,
@@ -322,7 +536,7 @@ class BackupEngine:
 
             if not valid:
                 # Verification failed
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 error_message = f"Backup verification failed: {error}"
                 self._update_backup_state(
                     service_name,
@@ -334,7 +548,7 @@ class BackupEngine:
                 return False
 
             # Calculate final duration
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
 
             # Update state as successful
             self._update_backup_state(
@@ -366,7 +580,7 @@ class BackupEngine:
 
         except Exception as e:
             # Catch-all for unexpected errors
-            duration = time.time() - start_time
+            duration = time.monotonic() - start_time
             error_message = str(e)
 
             # Update state to track the failure
@@ -396,7 +610,8 @@ class BackupEngine:
         """
         Get appropriate plugin for service type.
 
-        Plugins are cached to avoid re-instantiation. Routes to:
+        Plugins are cached to avoid re-instantiation, and service types
+        backed by the same plugin class share a single instance. Routes to:
         - HypervisorPlugin for vm/lxc types (e.g., ProxmoxPlugin)
         - ServicePlugin for docker/systemd/generic types
 
@@ -404,7 +619,7 @@ class BackupEngine:
             service: Service configuration
 
         Returns:
-            Plugin instance (cached)
+            Plugin instance (shared per plugin class)
 
         Raises:
             ValueError: If no plugin found for service type
@@ -426,47 +641,37 @@ class BackupEngine:
 
         # Check cache first
         if service_type in self._plugin_cache:
-            self.logger.debug(f"Using cached plugin for service type '{service_type}'")
+            self.logger.debug("Using cached plugin for service type '{}'", service_type)
             return self._plugin_cache[service_type]
 
-        # Define supported service types
-        hypervisor_types = ["vm", "lxc"]
-        service_types = ["docker", "systemd", "generic"]
-        supported_types = hypervisor_types + service_types
-
         # Validate service type is supported
-        if service_type not in supported_types:
+        if (
+            service_type not in self.HYPERVISOR_TYPES
+            and service_type not in self.SERVICE_TYPES
+        ):
             raise ValueError(
                 f"Unsupported service type '{service_type}' for service '{service.name}'. "
-                f"Supported types: {', '.join(supported_types)}"
+                f"Supported types: {', '.join(self.SUPPORTED_TYPES)}"
             )
 
-        # Instantiate appropriate plugin based on service type
-        plugin: Union[HypervisorPlugin, ServicePlugin]
-
-        if service_type in hypervisor_types:
-            # Use ProxmoxPlugin for VM/LXC types
-            self.logger.debug(
-                f"Instantiating ProxmoxPlugin for service type '{service_type}'"
-            )
-            plugin = ProxmoxPlugin(config=self.config, state=self.state)
-
-        elif service_type in service_types:
-            # Use GenericServicePlugin for Docker/systemd/generic types
-            self.logger.debug(
-                f"Instantiating GenericServicePlugin for service type '{service_type}'"
-            )
-            plugin = GenericServicePlugin(config=self.config, state=self.state)
-
-        else:
-            # Should never reach here due to validation above, but for safety
-            raise ValueError(
-                f"Unable to determine plugin for service type '{service_type}'"
-            )
+        # Share one instance per plugin class (vm/lxc -> ProxmoxPlugin,
+        # docker/systemd/generic -> GenericServicePlugin). Concurrent backup
+        # workers can miss the cache together, so instantiate under a lock.
+        plugin_class = self._plugin_class_for_type(service_type)
+        with self._plugin_lock:
+            plugin = self._plugin_instances.get(plugin_class)
+            if plugin is None:
+                self.logger.debug(
+                    "Instantiating {} for service type '{}'",
+                    plugin_class.__name__,
+                    service_type,
+                )
+                plugin = plugin_class(config=self.config, state=self.state)
+                self._plugin_instances[plugin_class] = plugin
 
-        # Cache the plugin
-        self._plugin_cache[service_type] = plugin
-        self.logger.debug(f"Cached {plugin.name} for service type '{service_type}'")
+            # Cache the plugin
+            self._plugin_cache[service_type] = plugin
+        self.logger.debug("Cached {} for service type '{}'", plugin.name, service_type)
 
         return plugin
 
@@ -481,14 +686,54 @@ class BackupEngine:
             >>> engine._clear_plugin_cache()
         """
         self._plugin_cache.clear()
+        self._plugin_instances.clear()
+        self._clear_backup_dir_cache()
         self.logger.debug("Plugin cache cleared")
 
+    def _clear_backup_dir_cache(self) -> None:
+        """
+        Forget resolved and ensured backup directories.
+
+        The next _get_backup_directory() call per service resolves the path
+        again and re-creates the directory if it was removed. The backup
+        root still comes from _backup_config_cache, which is not cleared,
+        so a changed backup.root is not picked up.
+
+        Example:
+            >>> engine._clear_backup_dir_cache()
+        """
+        self._backup_dir_cache.clear()
+        self._ensured_dirs.clear()
+
+    def _plugin_class_for_type(self, service_type: str) -> type:
+        """
+        Map a (lowercase) service type to the plugin class that handles it.
+
+        Args:
+            service_type: Lowercase service type
+
+        Returns:
+            Plugin class for the service type
+
+        Raises:
+            ValueError: If no plugin class handles the service type
+        """
+        if service_type in self.HYPERVISOR_TYPES:
+            return ProxmoxPlugin
+        if service_type in self.SERVICE_TYPES:
+            return GenericServicePlugin
+        raise ValueError(
+            f"Unable to determine plugin for service type '{service_type}'"
+        )
+
     # ========================================================================
     # Backup Operations
     # ========================================================================
 
     # pylint: disable=too-many-locals
-    def _determine_backup_destination(self, service: ServiceConfig) -> Dict[str, Any]:
+    def _determine_backup_destination(
+        self, service: ServiceConfig
+    ) -> BackupDestination:
         """
         Determine where and how to backup based on configuration.
 
@@ -520,69 +765,55 @@ class BackupEngine:
         service_type = service.type.lower()
 
         # For VM/LXC types, check PBS -> direct storage -> local
-        if service_type in ["vm", "lxc"]:
+        if service_type in self.HYPERVISOR_TYPES:
             # 1a. Check PBS first
             pbs_config = backup_config.get("proxmox_backup_server")
             if pbs_config and pbs_config.get("enabled"):
                 self.logger.debug(
-                    f"Service '{service.name}' ({service_type}): Checking PBS configuration"
+                    "Service '{}' ({}): Checking PBS configuration",
+                    service.name,
+                    service_type,
                 )
 
-                # Validate PBS config is complete
-                required_fields = ["server", "datastore", "username"]
-                missing_fields = [
-                    field for field in required_fields if not pbs_config.get(field)
-                ]
-                if missing_fields:
-                    raise BackupError(
-                        f"PBS is enabled but configuration is incomplete. "
-                        f"Missing required fields: {', '.join(missing_fields)}. "
-                        f"Please update global.backup.proxmox_backup_server in your configuration."
-                    )
+                # Validate PBS config is complete (once per config object;
+                # _get_backup_config() returns the same cached dict each call)
+                if pbs_config is not self._validated_pbs_config:
+                    missing_fields = [
+                        field
+                        for field in self.PBS_REQUIRED_FIELDS
+                        if not pbs_config.get(field)
+                    ]
+                    if missing_fields:
+                        raise BackupError(
+                            f"PBS is enabled but configuration is incomplete. "
+                            f"Missing required fields: {', '.join(missing_fields)}. "
+                            f"Please update global.backup.proxmox_backup_server in your configuration."
+                        )
+                    self._validated_pbs_config = pbs_config
 
                 # Validate PBS connectivity
                 server = pbs_config["server"]
                 port = pbs_config.get("port", 8007)
                 verify_ssl = pbs_config.get("verify_ssl", True)
 
-                self.logger.debug(f"Validating PBS connectivity to {server}:{port}")
-
-                try:
-                    # Use a lightweight API endpoint to test connectivity
-                    url = f"https://{server}:{port}/api2/json/version"
-                    response = requests.get(url, verify=verify_ssl, timeout=5)
-                    response.raise_for_status()
-
-                    self.logger.info(
-                        f"Service '{service.name}': Using PBS at {server}:{port}"
-                    )
+                self._check_pbs_connectivity(server, port, verify_ssl)
 
-                    return {
-                        "method": "pbs",
-                        "pbs_config": pbs_config,
-                    }
+                self.logger.info(
+                    f"Service '{service.name}': Using PBS at {server}:{port}"
+                )
 
-                except requests.exceptions.Timeout as exc:
-                    raise BackupError(
-                        f"PBS connectivity check failed: Connection to {server}:{port} timed out after 5 seconds. "
-                        f"Please verify the server is reachable and the configuration is correct."
-                    ) from exc
-                except requests.exceptions.ConnectionError as e:
-                    raise BackupError(
-                        f"PBS connectivity check failed: Cannot connect to {server}:{port}. "
-                        f"Error: {e}. Please verify the server address and network connectivity."
-                    ) from e
-                except requests.exceptions.RequestException as e:
-                    raise BackupError(
-                        f"PBS connectivity check failed for {server}:{port}: {e}. "
-                        f"Please verify the PBS server is running and accessible."
-                    ) from e
+                return {
+                    "method": "pbs",
+                    "pbs_config": pbs_config,
+                }
 
             # 1b. Check direct storage next
             direct_config = backup_config.get("direct_storage")
             if direct_config and direct_config.get("enabled"):
                 self.logger.debug(
-                    f"Service '{service.name}' ({service_type}): Checking direct storage configuration"
+                    "Service '{}' ({}): Checking direct storage configuration",
+                    service.name,
+                    service_type,
                 )
 
                 # Validate that path is configured
@@ -595,15 +826,12 @@ class BackupEngine:
 
                 # Cluster safety: Warn if path doesn't look like shared storage
                 path_str = str(direct_path)
-                shared_prefixes = ["/mnt", "/nfs", "/ceph"]
-                is_shared = any(
-                    path_str.startswith(prefix) for prefix in shared_prefixes
-                )
+                is_shared = path_str.startswith(self.SHARED_STORAGE_PREFIXES)
 
                 if not is_shared:
                     self.logger.warning(
                         f"Direct storage path '{path_str}' does not appear to be on shared storage "
-                        f"(expected path starting with {', '.join(shared_prefixes)}). "
+                        f"(expected path starting with {', '.join(self.SHARED_STORAGE_PREFIXES)}). "
                         f"In a cluster environment, this may cause backups to be inaccessible from other nodes."
                     )
 
@@ -618,13 +846,15 @@ class BackupEngine:
 
             # 1c. Fallback to local
             self.logger.debug(
-                f"Service '{service.name}' ({service_type}): Using local backup (fallback)"
+                "Service '{}' ({}): Using local backup (fallback)",
+                service.name,
+                service_type,
             )
 
         # For other service types (docker, systemd, generic, host), always use local
         else:
             self.logger.debug(
-                f"Service '{service.name}' ({service_type}): Using local backup"
+                "Service '{}' ({}): Using local backup", service.name, service_type
             )
 
         # Return local backup configuration
@@ -634,11 +864,108 @@ class BackupEngine:
             "path": backup_root,
         }
 
+    def _check_pbs_connectivity(self, server: str, port: int, verify_ssl: bool) -> None:
+        """
+        Verify the PBS API is reachable, reusing recent successful checks.
+
+        A successful probe is cached per (server, port) for
+        PBS_PROBE_TTL_SECONDS, so a run backing up many VMs/LXCs performs one
+        HTTPS round-trip instead of one per service. Probes are serialized so
+        concurrent backups share one in-flight check, and they share a pooled
+        requests.Session so retries after expiry reuse the TLS connection.
+
+        Args:
+            server: PBS server hostname or IP
+            port: PBS API port
+            verify_ssl: Whether to verify the server certificate
+
+        Raises:
+            BackupError: If the PBS server cannot be reached
+        """
+        cache_key = (server, port)
+        if self._pbs_probe_is_fresh(cache_key):
+            self.logger.debug(
+                "Using cached PBS connectivity check for {}:{}", server, port
+            )
+            return
+
+        # Concurrent service backups wait for a single in-flight probe
+        # instead of all hitting PBS at once
+        with self._pbs_probe_lock:
+            if self._pbs_probe_is_fresh(cache_key):
+                return
+
+            self.logger.debug("Validating PBS connectivity to {}:{}", server, port)
+
+            try:
+                # Use a lightweight API endpoint to test connectivity
+                url = f"https://{server}:{port}/api2/json/version"
+                response = self._get_pbs_session().get(
+                    url, verify=verify_ssl, timeout=5
+                )
+                response.raise_for_status()
+
+            except requests.exceptions.Timeout as exc:
+                raise BackupError(
+                    f"PBS connectivity check failed: Connection to {server}:{port} timed out after 5 seconds. "
+                    f"Please verify the server is reachable and the configuration is correct."
+                ) from exc
+            except requests.exceptions.ConnectionError as e:
+                raise BackupError(
+                    f"PBS connectivity check failed: Cannot connect to {server}:{port}. "
+                    f"Error: {e}. Please verify the server address and network connectivity."
+                ) from e
+            except requests.exceptions.RequestException as e:
+                raise BackupError(
+                    f"PBS connectivity check failed for {server}:{port}: {e}. "
+                    f"Please verify the PBS server is running and accessible."
+                ) from e
+
+            self._pbs_probe_cache[cache_key] = (
+                time.monotonic() + self.PBS_PROBE_TTL_SECONDS
+            )
+
+    def _pbs_probe_is_fresh(self, cache_key: Tuple[str, int]) -> bool:
+        """
+        Check whether a successful PBS probe for cache_key is still valid.
+
+        Args:
+            cache_key: (server, port) tuple
+
+        Returns:
+            True if a cached probe has not yet expired
+        """
+        expires_at = self._pbs_probe_cache.get(cache_key)
+        return expires_at is not None and time.monotonic() < expires_at
+
+    def _get_pbs_session(self) -> requests.Session:
+        """
+        Return the shared HTTP session used for PBS API calls.
+
+        Created on first use with a pooled HTTPS adapter so concurrent
+        service backups reuse warm TLS connections instead of opening one
+        per request.
+
+        Returns:
+            requests.Session with a pooled HTTPS adapter mounted
+        """
+        if self._pbs_session is None:
+            session = requests.Session()
+            session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=self.PBS_POOL_CONNECTIONS,
+                    pool_maxsize=self.PBS_POOL_MAXSIZE,
+                ),
+            )
+            self._pbs_session = session
+        return self._pbs_session
+
     # pylint: disable=too-many-branches
     def _create_backup_metadata(
         self,
         service: ServiceConfig,
-        backup_destination: Dict[str, Any],
+        backup_destination: BackupDestination,
         backup_path: Optional[Path] = None,
         duration_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
@@ -667,11 +994,14 @@ class BackupEngine:
             >>> print(metadata['service_name'])  # 'nextcloud'
             >>> print(metadata['backup_method'])  # 'pbs' or 'direct' or 'local'
         """
+        service_type = service.type.lower()
+        method = backup_destination["method"]
+
         # Extract basic service information
         metadata: Dict[str, Any] = {
             "service_name": service.name,
-            "service_type": service.type.lower(),
-            "backup_method": backup_destination["method"],
+            "service_type": service_type,
+            "backup_method": method,
             "timestamp": datetime.now().isoformat(),
             "status": "pending",  # Initial status, updated later by backup operation
         }
@@ -680,18 +1010,20 @@ class BackupEngine:
         if backup_path is not None:
             metadata["backup_path"] = str(backup_path)
 
-            # Calculate file size if path exists
+            # Calculate file size if path exists (single stat, no exists() probe)
             try:
-                if backup_path.exists():
-                    metadata["file_size_bytes"] = backup_path.stat().st_size
-                    self.logger.debug(
-                        f"Backup file size for {service.name}: {metadata['file_size_bytes']} bytes"
-                    )
-                else:
-                    metadata["file_size_bytes"] = None
-                    self.logger.debug(
-                        f"Backup path {backup_path} does not exist yet, file_size set to None"
-                    )
+                metadata["file_size_bytes"] = backup_path.stat().st_size
+                self.logger.debug(
+                    "Backup file size for {}: {} bytes",
+                    service.name,
+                    metadata["file_size_bytes"],
+                )
+            except FileNotFoundError:
+                metadata["file_size_bytes"] = None
+                self.logger.debug(
+                    "Backup path {} does not exist yet, file_size set to None",
+                    backup_path,
+                )
             except PermissionError as e:
                 self.logger.warning(
                     f"Permission denied when checking backup file size for {backup_path}: {e}. "
@@ -715,13 +1047,13 @@ class BackupEngine:
             metadata["duration_seconds"] = None
 
         # Add VM/LXC specific fields
-        if service.type.lower() in ["vm", "lxc"]:
+        if service_type in self.HYPERVISOR_TYPES:
             if service.vmid is not None:
                 metadata["vmid"] = service.vmid
             else:
                 metadata["vmid"] = None
                 self.logger.debug(
-                    f"Service {service.name} is type {service.type} but has no vmid"
+                    "Service {} is type {} but has no vmid", service.name, service.type
                 )
 
             # Add node as hint (cluster-safe: not authoritative)
@@ -729,14 +1061,14 @@ class BackupEngine:
                 metadata["node"] = service.node
             else:
                 metadata["node"] = None
-                self.logger.debug(f"Service {service.name} has no node specified")
+                self.logger.debug("Service {} has no node specified", service.name)
         else:
             # Non-VM/LXC services don't have vmid or node
             metadata["vmid"] = None
             metadata["node"] = None
 
         # Add PBS-specific details if using PBS backup
-        if backup_destination["method"] == "pbs":
+        if method == "pbs":
             pbs_config = backup_destination.get("pbs_config", {})
             metadata["pbs_details"] = {
                 "server": pbs_config.get("server"),
@@ -745,14 +1077,19 @@ class BackupEngine:
                 # Don't include password for security
             }
             self.logger.debug(
-                f"Added PBS details for {service.name}: {pbs_config.get('server')}/{pbs_config.get('datastore')}"
+                "Added PBS details for {}: {}/{}",
+                service.name,
+                pbs_config.get("server"),
+                pbs_config.get("datastore"),
             )
         else:
             metadata["pbs_details"] = None
 
         self.logger.debug(
-            f"Created backup metadata for {service.name}: method={metadata['backup_method']}, "
-            f"status={metadata['status']}"
+            "Created backup metadata for {}: method={}, status={}",
+            service.name,
+            metadata["backup_method"],
+            metadata["status"],
         )
 
         return metadata
@@ -761,7 +1098,7 @@ class BackupEngine:
     def _execute_backup_command(
         self,
         service: ServiceConfig,
-        backup_destination: Dict[str, Any],
+        backup_destination: BackupDestination,
         _backup_metadata: Dict[str, Any],
     ) -> Dict[str, Any]:
         """
@@ -796,8 +1133,12 @@ class BackupEngine:
             >>> if result['success']:
             ...     print(f"Backup created at {result['backup_path']}")
         """
+        # Handle dry run mode
+        if self.dry_run:
+            return self._simulate_backup(service, backup_destination)
+
         method = backup_destination["method"]
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Initialize result dict
         result: Dict[str, Any] = {
@@ -807,94 +1148,34 @@ class BackupEngine:
             "error_message": None,
         }
 
-        # Handle dry run mode
-        if self.dry_run:
-            self.logger.info(
-                f"DRY RUN: Would execute {method} backup for service '{service.name}'"
-            )
-
-            # Simulate successful backup with mock duration
-            mock_duration = round(time.time() - start_time + 0.1, 2)
-
-            # For local/direct methods, generate what the path WOULD be
-            mock_path = None
-            if method == "local":
-                filename = self._generate_backup_filename(service.name, service.type)
-                mock_path = Path(backup_destination["path"]) / service.name / filename
-            elif method == "direct":
-                filename = self._generate_backup_filename(service.name, service.type)
-                mock_path = Path(backup_destination["path"]) / filename
-
-            return {
-                "success": True,
-                "backup_path": mock_path,
-                "duration_seconds": mock_duration,
-                "error_message": None,
-            }
-
         # Log backup start
         self.logger.info(
-            f"Starting {method} backup for service '{service.name}' (type: {service.type})"
+            "Starting {} backup for service '{}' (type: {})",
+            method,
+            service.name,
+            service.type,
         )
 
         try:
             # Get plugin for service
             plugin = self._get_plugin_for_service(service)
 
-            # Execute backup based on method
-            if method == "pbs":
-                # PBS backup: delegate to plugin
-                pbs_config = backup_destination["pbs_config"]
-                success = plugin.backup_to_pbs(service, pbs_config)
-
-                if success:
-                    result["success"] = True
-                    result["backup_path"] = None  # PBS stores internally
-                    self.logger.info(
-                        f"PBS backup completed for service '{service.name}'"
-                    )
-                else:
-                    result["error_message"] = (
-                        "PBS backup failed. Check PBS server logs for details."
-                    )
-                    self.logger.error(f"PBS backup failed for service '{service.name}'")
-
-            elif method == "direct":
-                # Direct storage backup: plugin creates backup at specified path
-                storage_path = backup_destination["path"]
-                backup_path = plugin.backup_to_storage(service, storage_path)
-
-                result["success"] = True
-                result["backup_path"] = backup_path
-                self.logger.info(
-                    f"Direct storage backup completed for service '{service.name}' at {backup_path}"
-                )
-
-            elif method == "local":
-                # Local backup: generate filename and full path
-                filename = self._generate_backup_filename(service.name, service.type)
-                backup_dir = Path(backup_destination["path"]) / service.name
-
-                # Ensure backup directory exists
-                backup_dir.mkdir(parents=True, exist_ok=True)
-
-                backup_path = backup_dir / filename
-                plugin.backup(service, backup_path)
-
-                result["success"] = True
-                result["backup_path"] = backup_path
-                self.logger.info(
-                    f"Local backup completed for service '{service.name}' at {backup_path}"
-                )
-
-            else:
+            executor = self._backup_executors.get(method)
+            if executor is None:
                 # Unknown method (should never happen due to validation)
                 result["error_message"] = (
                     f"Unknown backup method '{method}'. This is a bug."
                 )
                 self.logger.error(
-                    f"Unknown backup method '{method}' for service '{service.name}'"
+                    "Unknown backup method '{}' for service '{}'", method, service.name
                 )
+            else:
+                success, backup_path, error_message = executor(
+                    plugin, service, backup_destination
+                )
+                result["success"] = success
+                result["backup_path"] = backup_path
+                result["error_message"] = error_message
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             # Catch all exceptions and return failure result (intentionally broad for safety)
@@ -904,29 +1185,147 @@ class BackupEngine:
             )
             result["error_message"] = error_msg
 
-            # Log with full traceback
-            self.logger.error(
-                f"Backup failed for service '{service.name}':\n{traceback.format_exc()}"
-            )
+            # Log with full traceback (formatted by loguru only when emitted)
+            self.logger.exception("Backup failed for service '{}'", service.name)
 
         # Calculate duration
-        duration = round(time.time() - start_time, 2)
+        duration = round(time.monotonic() - start_time, 2)
         result["duration_seconds"] = duration
 
         # Log completion
         if result["success"]:
             self.logger.info(
-                f"Backup completed for service '{service.name}' in {duration}s"
+                "Backup completed for service '{}' in {}s", service.name, duration
             )
         else:
             self.logger.error(
-                f"Backup failed for service '{service.name}' after {duration}s: {result['error_message']}"
+                "Backup failed for service '{}' after {}s: {}",
+                service.name,
+                duration,
+                result["error_message"],
             )
 
         return result
 
+    def _simulate_backup(
+        self, service: ServiceConfig, backup_destination: BackupDestination
+    ) -> Dict[str, Any]:
+        """
+        Build the dry-run result for _execute_backup_command().
+
+        Reports success with a fixed mock duration and, for local/direct
+        methods, the path the backup WOULD be written to. Nothing is created.
+
+        Args:
+            service: Service configuration
+            backup_destination: Output from _determine_backup_destination()
+
+        Returns:
+            Result dict in the same shape as _execute_backup_command()
+        """
+        method = backup_destination["method"]
+        self.logger.info(
+            "DRY RUN: Would execute {} backup for service '{}'", method, service.name
+        )
+
+        # For local/direct methods, generate what the path WOULD be
+        mock_path = None
+        if method in ("local", "direct"):
+            mock_path = Path(backup_destination["path"])
+            if method == "local":
+                mock_path /= service.name
+            mock_path /= self._generate_backup_filename(service.name, service.type)
+
+        return {
+            "success": True,
+            "backup_path": mock_path,
+            "duration_seconds": self.DRY_RUN_DURATION_SECONDS,
+            "error_message": None,
+        }
+
+    def _run_pbs_backup(
+        self,
+        plugin: Union[HypervisorPlugin, ServicePlugin],
+        service: ServiceConfig,
+        backup_destination: BackupDestination,
+    ) -> Tuple[bool, Optional[Path], Optional[str]]:
+        """
+        Run a PBS backup through the plugin.
+
+        Args:
+            plugin: Plugin handling the service
+            service: Service configuration
+            backup_destination: Destination dict containing pbs_config
+
+        Returns:
+            Tuple of (success, backup_path, error_message); PBS stores
+            backups internally so backup_path is always None
+        """
+        if plugin.backup_to_pbs(service, backup_destination["pbs_config"]):
+            self.logger.info("PBS backup completed for service '{}'", service.name)
+            return True, None, None
+
+        self.logger.error("PBS backup failed for service '{}'", service.name)
+        return False, None, "PBS backup failed. Check PBS server logs for details."
+
+    def _run_direct_backup(
+        self,
+        plugin: Union[HypervisorPlugin, ServicePlugin],
+        service: ServiceConfig,
+        backup_destination: BackupDestination,
+    ) -> Tuple[bool, Optional[Path], Optional[str]]:
+        """
+        Run a direct storage backup; the plugin writes to the storage path.
+
+        Args:
+            plugin: Plugin handling the service
+            service: Service configuration
+            backup_destination: Destination dict containing path
+
+        Returns:
+            Tuple of (success, backup_path, error_message)
+        """
+        backup_path = plugin.backup_to_storage(service, backup_destination["path"])
+        self.logger.info(
+            "Direct storage backup completed for service '{}' at {}",
+            service.name,
+            backup_path,
+        )
+        return True, backup_path, None
+
+    def _run_local_backup(
+        self,
+        plugin: Union[HypervisorPlugin, ServicePlugin],
+        service: ServiceConfig,
+        backup_destination: BackupDestination,
+    ) -> Tuple[bool, Optional[Path], Optional[str]]:
+        """
+        Run a local backup into <path>/<service>/<generated filename>.
+
+        Args:
+            plugin: Plugin handling the service
+            service: Service configuration
+            backup_destination: Destination dict containing path
+
+        Returns:
+            Tuple of (success, backup_path, error_message)
+        """
+        filename = self._generate_backup_filename(service.name, service.type)
+        backup_dir = Path(backup_destination["path"]) / service.name
+
+        # Ensure backup directory exists
+        self._ensure_directory(backup_dir)
+
+        backup_path = backup_dir / filename
+        plugin.backup(service, backup_path)
+
+        self.logger.info(
+            "Local backup completed for service '{}' at {}", service.name, backup_path
+        )
+        return True, backup_path, None
+
     def _perform_backup(
-        self, service: ServiceConfig, destination: Dict[str, Any]
+        self, service: ServiceConfig, destination: BackupDestination
     ) -> bool:
         """
         Perform the actual backup operation.
@@ -948,17 +1347,22 @@ class BackupEngine:
         """
         raise NotImplementedError
 
-    def verify_backup(self, backup_path: Path) -> bool:
+    def verify_backup(self, backup_path: Path, deep: bool = False) -> bool:
         """
         Verify backup integrity.
 
         Performs basic validation:
         - File exists
-        - File size > 0
-        - Can read/extract archive (if applicable)
+        - File size meets the minimum
+        - Archive header is readable (if applicable)
+
+        With deep=True the whole archive is read as well: every tar member
+        is walked, or a gzip file is decompressed to EOF so its CRC is
+        checked. This costs a full read of the backup.
 
         Args:
             backup_path: Path to backup file
+            deep: Read the whole archive instead of only its header
 
         Returns:
             True if backup is valid
@@ -968,7 +1372,73 @@ class BackupEngine:
             >>> if engine.verify_backup(backup_file):
             ...     print("Backup is valid")
         """
-        raise NotImplementedError
+        # Backups live in {root}/{service}/, so the parent names the service
+        service_name = backup_path.parent.name or backup_path.name
+        success, _ = self._verify_backup_integrity(
+            str(backup_path), service_name, deep=deep
+        )
+        return success
+
+    def verify_backups(
+        self,
+        backup_paths: list[Path],
+        max_parallel: Optional[int] = None,
+        deep: bool = False,
+    ) -> Dict[Path, bool]:
+        """
+        Verify many backup files concurrently.
+
+        Each check is mostly waiting on stat and header reads, so a bounded
+        thread pool overlaps them (e.g. when re-checking every retained
+        backup after a disk event).
+
+        Args:
+            backup_paths: Backup files to verify
+            max_parallel: Maximum checks running at once
+                          (default MAX_PARALLEL_VERIFICATIONS)
+            deep: Passed to verify_backup() for every file
+
+        Returns:
+            Dict mapping backup path -> verify_backup() result, in input order;
+            a check that raises is logged and recorded as False
+
+        Example:
+            >>> results = engine.verify_backups(engine._get_backup_files("nextcloud"))
+            >>> bad = [path for path, ok in results.items() if not ok]
+        """
+        if not backup_paths:
+            return {}
+
+        workers = min(
+            max_parallel or self.MAX_PARALLEL_VERIFICATIONS, len(backup_paths)
+        )
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="verify"
+        ) as executor:
+            outcomes = executor.map(
+                partial(self._verify_backup_or_false, deep=deep), backup_paths
+            )
+            return dict(zip(backup_paths, outcomes))
+
+    def _verify_backup_or_false(self, backup_path: Path, deep: bool = False) -> bool:
+        """
+        Run verify_backup() for one file, treating an exception as a failure.
+
+        executor.map() re-raises the first worker exception, so without this
+        one unreadable archive would discard every other file's result.
+
+        Args:
+            backup_path: Path to backup file
+            deep: Read the whole archive instead of only its header
+
+        Returns:
+            verify_backup() result, or False if it raised
+        """
+        try:
+            return self.verify_backup(backup_path, deep=deep)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.warning(f"Backup verification error for {backup_path}: {e}")
+            return False
 
     # ========================================================================
     # Retention Policy
@@ -1001,7 +1471,8 @@ class BackupEngine:
         Identify old backup files that should be deleted based on retention policy.
 
         Compares backup file ages against retention_days configuration and
-        returns list of files that exceed the retention period.
+        returns list of files that exceed the retention period. The newest
+        MIN_BACKUPS_TO_KEEP files are never returned, whatever their age.
 
         Args:
             service_name: Service name
@@ -1023,8 +1494,9 @@ class BackupEngine:
 
             if retention_days is None or retention_days <= 0:
                 self.logger.debug(
-                    f"Retention policy disabled for '{service_name}' "
-                    f"(retention_days={retention_days})"
+                    "Retention policy disabled for '{}' (retention_days={})",
+                    service_name,
+                    retention_days,
                 )
                 return []
 
@@ -1033,34 +1505,38 @@ class BackupEngine:
                 f"Failed to get backup configuration for '{service_name}': {e}"
             ) from e
 
-        # Get all backup files
-        all_files = self._get_backup_files(service_name)
+        # Calculate cutoff time (now - retention_days)
+        cutoff_time = time.time() - (retention_days * 24 * 60 * 60)
 
-        if not all_files:
-            self.logger.debug(f"No backup files found for '{service_name}'")
+        # Stream the listing and keep only expired files, so only those need
+        # sorting (oldest first) instead of the whole directory
+        total_count = 0
+        expired = []
+        for path, file_stat in self._iter_backup_files(service_name):
+            total_count += 1
+            if file_stat.st_mtime < cutoff_time:
+                expired.append((file_stat.st_mtime, path))
+
+        if not total_count:
+            self.logger.debug("No backup files found for '{}'", service_name)
             return []
 
-        # Calculate cutoff time (now - retention_days)
-        cutoff_time = time.time() - (retention_days * 24 * 60 * 60)
+        expired.sort()
 
-        # Identify files older than retention period
-        files_to_delete = []
-        for file_path in all_files:
-            try:
-                file_mtime = file_path.stat().st_mtime
-                if file_mtime < cutoff_time:
-                    files_to_delete.append(file_path)
-            except OSError as e:
-                self.logger.warning(
-                    f"Could not stat file {file_path} for '{service_name}': {e}"
-                )
-                # Continue with other files
-                continue
+        # Never expire the newest backups, even when all of them are past the
+        # cutoff (e.g. backups have been failing for longer than retention)
+        shortfall = self.MIN_BACKUPS_TO_KEEP - (total_count - len(expired))
+        if shortfall > 0:
+            del expired[max(len(expired) - shortfall, 0) :]
+
+        files_to_delete = [path for _, path in expired]
 
         self.logger.debug(
-            f"Retention policy for '{service_name}': "
-            f"{len(files_to_delete)} of {len(all_files)} files exceed "
-            f"{retention_days}-day retention"
+            "Retention policy for '{}': {} of {} files exceed {}-day retention",
+            service_name,
+            len(files_to_delete),
+            total_count,
+            retention_days,
         )
 
         return files_to_delete
@@ -1113,45 +1589,55 @@ class BackupEngine:
             self.logger.info(f"No old backups to delete for '{service_name}'")
             return 0
 
+        # Bind log methods once for the per-file loops below
+        info = self.logger.info
+        warning = self.logger.warning
+
         # Dry-run mode: log what would be deleted but don't delete
         if self.dry_run:
-            self.logger.info(
-                f"[DRY RUN] Would delete {len(files_to_delete)} old backups "
-                f"for '{service_name}':"
+            info(
+                "[DRY RUN] Would delete {} old backups for '{}':",
+                len(files_to_delete),
+                service_name,
             )
             for file_path in files_to_delete:
-                self.logger.info(f"[DRY RUN]   - {file_path.name}")
+                info("[DRY RUN]   - {}", file_path.name)
             return 0
 
         # Delete files and count successes
         deleted_count = 0
         for file_path in files_to_delete:
             try:
-                file_path.unlink()
+                # One unlink syscall; a vanished file raises FileNotFoundError
+                # below instead of being probed with exists() first
+                os.unlink(file_path)
                 deleted_count += 1
-                self.logger.info(
-                    f"Deleted old backup for '{service_name}': {file_path.name}"
-                )
+                info("Deleted old backup for '{}': {}", service_name, file_path.name)
             except FileNotFoundError:
                 # File was already deleted (race condition or external deletion)
-                self.logger.warning(
-                    f"Backup file already deleted for '{service_name}': "
-                    f"{file_path.name}"
+                warning(
+                    "Backup file already deleted for '{}': {}",
+                    service_name,
+                    file_path.name,
                 )
                 # Don't count as success, but continue with others
                 continue
             except PermissionError as e:
                 # Permission denied - log but continue
-                self.logger.warning(
-                    f"Permission denied deleting backup for '{service_name}': "
-                    f"{file_path.name} - {e}"
+                warning(
+                    "Permission denied deleting backup for '{}': {} - {}",
+                    service_name,
+                    file_path.name,
+                    e,
                 )
                 continue
             except OSError as e:
                 # Other OS error - log but continue
-                self.logger.warning(
-                    f"Error deleting backup for '{service_name}': "
-                    f"{file_path.name} - {e}"
+                warning(
+                    "Error deleting backup for '{}': {} - {}",
+                    service_name,
+                    file_path.name,
+                    e,
                 )
                 continue
 
@@ -1177,27 +1663,81 @@ class BackupEngine:
             >>> backups = engine._get_backup_files("nextcloud")
             >>> print(f"Found {len(backups)} backups")
         """
+        files = [path for path, _ in self._get_backup_file_stats(service_name)]
+
+        self.logger.debug("Found {} backup files for {}", len(files), service_name)
+
+        return files
+
+    def _get_backup_file_stats(
+        self, service_name: str
+    ) -> list[Tuple[Path, os.stat_result]]:
+        """
+        Get (path, stat) pairs for a service's backup files, oldest first.
+
+        Each file is stat'ed exactly once while listing; callers that need
+        mtimes or sizes use these stat results instead of stat'ing the paths
+        again.
+
+        Args:
+            service_name: Service name
+
+        Returns:
+            List of (path, stat_result) tuples sorted by mtime (oldest first);
+            empty if the directory is missing or unreadable
+        """
+        file_stats = list(self._iter_backup_files(service_name))
+
+        # Sort by modification time (oldest first)
+        file_stats.sort(key=lambda item: item[1].st_mtime)
+
+        return file_stats
+
+    def _iter_backup_files(
+        self, service_name: str
+    ) -> Iterator[Tuple[Path, os.stat_result]]:
+        """
+        Lazily yield (path, stat) pairs for a service's backup files, unsorted.
+
+        Only the directory listing is held in memory; each file is stat'ed as
+        it is yielded, so callers that filter (e.g. retention) keep just the
+        entries they need. Files removed between listing and stat are skipped.
+
+        Args:
+            service_name: Service name
+
+        Yields:
+            (path, stat_result) tuples in inode order; nothing if the
+            directory is missing or unreadable
+        """
         # Get backup directory
         backup_dir = self._get_backup_directory(service_name)
 
-        # Check if directory exists (should always exist after _get_backup_directory)
-        if not backup_dir.exists():
-            self.logger.warning(f"Backup directory does not exist: {backup_dir}")
-            return []
-
-        # Get all files (not directories) in backup directory
+        # Get all files (not directories) in backup directory. scandir yields
+        # the file type with each entry, and DirEntry caches its stat result,
+        # so each file is stat'ed once. Entries are stat'ed in inode order so
+        # cold-cache scans walk the inode table forward instead of seeking
+        # back and forth.
         try:
-            files = [f for f in backup_dir.iterdir() if f.is_file()]
+            with os.scandir(backup_dir) as entries:
+                file_entries = [entry for entry in entries if entry.is_file()]
+        except FileNotFoundError:
+            # Should always exist after _get_backup_directory, unless removed
+            self.logger.warning(f"Backup directory does not exist: {backup_dir}")
+            return
         except OSError as e:
             self.logger.error(f"Error reading backup directory {backup_dir}: {e}")
-            return []
-
-        # Sort by modification time (oldest first)
-        files.sort(key=lambda f: f.stat().st_mtime)
-
-        self.logger.debug(f"Found {len(files)} backup files for {service_name}")
+            return
 
-        return files
+        # Join names onto the known directory rather than re-parsing each
+        # entry.path string through Path()
+        file_entries.sort(key=lambda entry: entry.inode())
+        for entry in file_entries:
+            try:
+                yield backup_dir / entry.name, entry.stat()
+            except FileNotFoundError:
+                # Deleted after listing (e.g. concurrent rotation)
+                continue
 
     # ========================================================================
     # State Tracking
@@ -1270,26 +1810,34 @@ class BackupEngine:
 
         try:
             # Always update timestamp and status
-            self.state.set(f"last_backup.{service_name}", current_timestamp)
-            self.state.set(f"backup_status.{service_name}", status)
+            updates: Dict[str, Any] = {
+                f"last_backup.{service_name}": current_timestamp,
+                f"backup_status.{service_name}": status,
+            }
 
             if success:
                 # Success: Update path and duration if provided, clear error
                 if backup_path:
-                    self.state.set(f"backup_path.{service_name}", backup_path)
+                    updates[f"backup_path.{service_name}"] = backup_path
                 if duration is not None:
-                    self.state.set(f"backup_duration.{service_name}", str(duration))
+                    updates[f"backup_duration.{service_name}"] = str(duration)
                 # Clear any previous error
-                self.state.set(f"backup_error.{service_name}", None)
+                updates[f"backup_error.{service_name}"] = None
             else:
                 # Failure: Set error if provided, clear path and duration
                 if error_message:
-                    self.state.set(f"backup_error.{service_name}", error_message)
+                    updates[f"backup_error.{service_name}"] = error_message
                 # Clear path and duration (failed backup = no valid backup)
-                self.state.set(f"backup_path.{service_name}", None)
-                self.state.set(f"backup_duration.{service_name}", None)
+                updates[f"backup_path.{service_name}"] = None
+                updates[f"backup_duration.{service_name}"] = None
+
+            # Write all keys for this run in one statement and commit
+            self.state.set_many(updates)
+            self._missing_backup_expiry.pop(service_name, None)
 
-            self.logger.debug(f"Successfully updated backup state for '{service_name}'")
+            self.logger.debug(
+                "Successfully updated backup state for '{}'", service_name
+            )
 
         except Exception as e:
             error_msg = (
@@ -1302,6 +1850,11 @@ class BackupEngine:
         """
         Get the timestamp of the last successful backup for a service.
 
+        A "never backed up" result is cached for
+        LAST_BACKUP_NEGATIVE_TTL_SECONDS (or until this engine records a
+        backup for the service), so polling loops don't re-query the state
+        database for services that have no history.
+
         Args:
             service_name: Name of the service to query
 
@@ -1326,16 +1879,29 @@ class BackupEngine:
         if not service_name.strip():
             raise ValueError("Service name cannot be empty or whitespace only")
 
+        # Serve known-missing services from the negative cache
+        expiry = self._missing_backup_expiry.get(service_name)
+        if expiry is not None:
+            if time.monotonic() < expiry:
+                return None
+            # Another worker may already have dropped the expired entry
+            self._missing_backup_expiry.pop(service_name, None)
+
         # Query StateManager
         try:
-            self.logger.debug(f"Querying last backup time for service '{service_name}'")
+            self.logger.debug(
+                "Querying last backup time for service '{}'", service_name
+            )
             timestamp = self.state.get(f"last_backup.{service_name}")
 
             if timestamp:
-                self.logger.debug(f"Last backup for '{service_name}': {timestamp}")
+                self.logger.debug("Last backup for '{}': {}", service_name, timestamp)
             else:
                 self.logger.debug(
-                    f"No backup history found for service '{service_name}'"
+                    "No backup history found for service '{}'", service_name
+                )
+                self._missing_backup_expiry[service_name] = (
+                    time.monotonic() + self.LAST_BACKUP_NEGATIVE_TTL_SECONDS
                 )
 
             return timestamp
@@ -1374,14 +1940,14 @@ class BackupEngine:
 
         # Query StateManager
         try:
-            self.logger.debug(f"Querying backup status for service '{service_name}'")
+            self.logger.debug("Querying backup status for service '{}'", service_name)
             status = self.state.get(f"backup_status.{service_name}")
 
             if status:
-                self.logger.debug(f"Backup status for '{service_name}': {status}")
+                self.logger.debug("Backup status for '{}': {}", service_name, status)
             else:
                 self.logger.debug(
-                    f"No backup status found for service '{service_name}'"
+                    "No backup status found for service '{}'", service_name
                 )
 
             return status
@@ -1402,6 +1968,7 @@ class BackupEngine:
         backup_path: str,
         service_name: str,
         min_size_bytes: int = 1024,
+        deep: bool = False,
     ) -> Tuple[bool, Optional[str]]:
         """
         Verify the integrity of a backup file.
@@ -1411,10 +1978,15 @@ class BackupEngine:
         - File size is reasonable (not empty, meets minimum)
         - For compressed files: basic archive integrity check
 
+        By default only the archive header is probed, so verification cost
+        does not grow with backup size. Pass deep=True to walk every tar
+        member or decompress a gzip file to EOF (which checks its CRC).
+
         Args:
             backup_path: Path to the backup file to verify
             service_name: Name of service (for logging context)
             min_size_bytes: Minimum expected file size (default 1KB)
+            deep: Read the whole archive instead of only its header
 
         Returns:
             Tuple of (success: bool, error_message: Optional[str])
@@ -1455,53 +2027,53 @@ class BackupEngine:
         # Convert to Path object
         backup_file = Path(backup_path)
 
-        # Check file existence
-        if not backup_file.exists():
+        # Check existence, file type and size with a single stat() call
+        try:
+            backup_stat = os.stat(backup_path)
+        except (FileNotFoundError, NotADirectoryError):
             error_msg = f"Backup file does not exist: {backup_path}"
             self.logger.warning(
                 f"Backup verification failed for '{service_name}': {error_msg}"
             )
             return (False, error_msg)
+        except PermissionError as e:
+            error_msg = f"Permission denied reading backup file: {backup_path}"
+            self.logger.warning(
+                f"Backup verification failed for '{service_name}': {error_msg} - {e}"
+            )
+            return (False, error_msg)
+        except OSError as e:
+            error_msg = f"OS error accessing backup file: {backup_path} - {e}"
+            self.logger.warning(
+                f"Backup verification failed for '{service_name}': {error_msg}"
+            )
+            return (False, error_msg)
 
         # Check if file (not directory or other)
-        if not backup_file.is_file():
+        if not S_ISREG(backup_stat.st_mode):
             error_msg = f"Backup path is not a regular file: {backup_path}"
             self.logger.warning(
                 f"Backup verification failed for '{service_name}': {error_msg}"
             )
             return (False, error_msg)
 
-        # Check file readability and size
-        try:
-            file_size = backup_file.stat().st_size
-
-            # Check for empty file
-            if file_size == 0:
-                error_msg = f"Backup file is empty (0 bytes): {backup_path}"
-                self.logger.warning(
-                    f"Backup verification failed for '{service_name}': {error_msg}"
-                )
-                return (False, error_msg)
-
-            # Check minimum size
-            if file_size < min_size_bytes:
-                error_msg = (
-                    f"Backup file size ({file_size} bytes) is below minimum "
-                    f"({min_size_bytes} bytes): {backup_path}"
-                )
-                self.logger.warning(
-                    f"Backup verification failed for '{service_name}': {error_msg}"
-                )
-                return (False, error_msg)
+        # Check file size
+        file_size = backup_stat.st_size
 
-        except PermissionError as e:
-            error_msg = f"Permission denied reading backup file: {backup_path}"
+        # Check for empty file
+        if file_size == 0:
+            error_msg = f"Backup file is empty (0 bytes): {backup_path}"
             self.logger.warning(
-                f"Backup verification failed for '{service_name}': {error_msg} - {e}"
+                f"Backup verification failed for '{service_name}': {error_msg}"
             )
             return (False, error_msg)
-        except OSError as e:
-            error_msg = f"OS error accessing backup file: {backup_path} - {e}"
+
+        # Check minimum size
+        if file_size < min_size_bytes:
+            error_msg = (
+                f"Backup file size ({file_size} bytes) is below minimum "
+                f"({min_size_bytes} bytes): {backup_path}"
+            )
             self.logger.warning(
                 f"Backup verification failed for '{service_name}': {error_msg}"
             )
@@ -1523,12 +2095,13 @@ class BackupEngine:
                     )
                     return (False, error_msg)
 
-                # Try opening to verify integrity
-                with tarfile.open(backup_file, "r:gz") as tar:
-                    # Getting members list validates structure
-                    _ = tar.getmembers()
+                if deep:
+                    with tarfile.open(backup_file, "r:gz") as tar:
+                        # Getting members list validates structure
+                        _ = tar.getmembers()
 
-            except tarfile.TarError as e:
+            except (tarfile.TarError, EOFError, zlib.error) as e:
+                # EOFError/zlib.error: truncated or damaged gzip stream
                 error_msg = f"Corrupted tar.gz archive: {backup_path} - {e}"
                 self.logger.warning(
                     f"Backup verification failed for '{service_name}': {error_msg}"
@@ -1554,12 +2127,12 @@ class BackupEngine:
                     )
                     return (False, error_msg)
 
-                # Try opening to verify integrity
-                with tarfile.open(backup_file, "r:") as tar:
-                    # Getting members list validates structure
-                    _ = tar.getmembers()
+                if deep:
+                    with tarfile.open(backup_file, "r:") as tar:
+                        # Getting members list validates structure
+                        _ = tar.getmembers()
 
-            except tarfile.TarError as e:
+            except (tarfile.TarError, EOFError, zlib.error) as e:
                 error_msg = f"Corrupted tar archive: {backup_path} - {e}"
                 self.logger.warning(
                     f"Backup verification failed for '{service_name}': {error_msg}"
@@ -1576,10 +2149,15 @@ class BackupEngine:
         elif backup_name_lower.endswith(".gz"):
             try:
                 with gzip.open(backup_file, "rb") as gz:
-                    # Read first byte to verify it's valid gzip
-                    _ = gz.read(1)
-
-            except gzip.BadGzipFile as e:
+                    if deep:
+                        # Reading to EOF verifies the trailing CRC
+                        while gz.read(self.VERIFY_READ_CHUNK_BYTES):
+                            pass
+                    else:
+                        # Read first byte to verify it's valid gzip
+                        _ = gz.read(1)
+
+            except (gzip.BadGzipFile, EOFError, zlib.error) as e:
                 error_msg = f"Corrupted gzip file: {backup_path} - {e}"
                 self.logger.warning(
                     f"Backup verification failed for '{service_name}': {error_msg}"
@@ -1609,6 +2187,9 @@ class BackupEngine:
 
         Creates directory structure: {backup_root}/{service_name}/
 
+        The resolved directory is cached per service, so repeat calls skip
+        the config lookup and mkdir entirely.
+
         Args:
             service_name: Service name
 
@@ -1622,6 +2203,10 @@ class BackupEngine:
             >>> backup_dir = engine._get_backup_directory("nextcloud")
             >>> print(backup_dir)  # /mnt/backups/homelab/nextcloud/
         """
+        cached_dir = self._backup_dir_cache.get(service_name)
+        if cached_dir is not None:
+            return cached_dir
+
         # Get backup root from config
         try:
             backup_config = self._get_backup_config()
@@ -1636,8 +2221,8 @@ class BackupEngine:
 
         # Create directory if it doesn't exist (mkdir -p behavior)
         try:
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.debug(f"Backup directory ready: {backup_dir}")
+            self._ensure_directory(backup_dir)
+            self.logger.debug("Backup directory ready: {}", backup_dir)
         except OSError as e:
             error_msg = (
                 f"Failed to create backup directory {backup_dir}: {e}. "
@@ -1646,10 +2231,36 @@ class BackupEngine:
             self.logger.error(error_msg)
             raise BackupError(error_msg) from e
 
+        self._backup_dir_cache[service_name] = backup_dir
         return backup_dir
 
+    def _ensure_directory(self, directory: Path) -> None:
+        """
+        Create directory (mkdir -p) unless this engine already ensured it.
+
+        Directories created or confirmed once are remembered for the life of
+        the engine, so repeat backups skip the stat/mkdir syscalls. An
+        existing directory is confirmed with a single stat instead of a
+        mkdir that fails with EEXIST and is then stat'ed anyway.
+
+        Args:
+            directory: Directory to create
+
+        Raises:
+            OSError: If the directory cannot be created
+        """
+        if directory in self._ensured_dirs:
+            return
+        if not os.path.isdir(directory):
+            directory.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(directory)
+
     def _generate_backup_filename(
-        self, service_name: str, service_type: str, extension: str = "tar.gz"
+        self,
+        service_name: str,
+        service_type: str,
+        extension: str = "tar.gz",
+        timestamp: Optional[str] = None,
     ) -> str:
         """
         Generate backup filename with timestamp.
@@ -1657,10 +2268,15 @@ class BackupEngine:
         Format: {service_name}_{timestamp}_{type}.{extension}
         Timestamp format: YYYYMMDD_HHMMSS (sortable, filesystem-safe)
 
+        During backup_all_services() the run's shared timestamp is used, so
+        one strftime covers the whole batch.
+
         Args:
             service_name: Service name
             service_type: Service type (vm, lxc, docker, etc.)
             extension: File extension (default: tar.gz)
+            timestamp: Precomputed YYYYMMDD_HHMMSS timestamp (default: the
+                current run's timestamp, or now)
 
         Returns:
             Formatted filename
@@ -1670,10 +2286,13 @@ class BackupEngine:
             >>> print(filename)  # nextcloud_20250124_120000_vm.tar.gz
         """
         # Generate timestamp in sortable format: YYYYMMDD_HHMMSS
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = self._run_timestamp or datetime.now().strftime(
+                self.FILENAME_TIMESTAMP_FORMAT
+            )
 
         # Sanitize service name (replace spaces/special chars with underscores)
-        safe_service_name = service_name.replace(" ", "_").replace("/", "_")
+        safe_service_name = service_name.translate(_SAFE_NAME_TRANS)
 
         # Build filename
         filename = f"{safe_service_name}_{timestamp}_{service_type}.{extension}"
@@ -1710,7 +2329,10 @@ class BackupEngine:
         if not results:
             raise ValueError("results cannot be empty")
 
-        # Validate all keys are strings and all values are booleans
+        # Validate all keys are strings and all values are booleans, splitting
+        # successful and failed services in the same pass
+        successful_services = []
+        failed_services = []
         for key, value in results.items():
             if not isinstance(key, str):
                 raise ValueError(
@@ -1721,15 +2343,12 @@ class BackupEngine:
                     f"All result values must be booleans, got: {type(value).__name__} "
                     f"for service '{key}'"
                 )
+            (successful_services if value else failed_services).append(key)
 
         # Calculate summary stats
         total = len(results)
-        succeeded = sum(1 for success in results.values() if success)
-        failed = total - succeeded
-
-        # Get lists of successful and failed services
-        successful_services = [name for name, success in results.items() if success]
-        failed_services = [name for name, success in results.items() if not success]
+        succeeded = len(successful_services)
+        failed = len(failed_services)
 
         # Build subject/title
         subject = f"Homelab Autopilot Backup Summary - {succeeded}/{total} Successful"
@@ -1772,7 +2391,7 @@ class BackupEngine:
 
         # Log the summary
         self.logger.info(
-            f"Backup summary: {succeeded}/{total} successful, {failed} failed"
+            "Backup summary: {}/{} successful, {} failed", succeeded, total, failed
         )
 
         # Dry-run mode: log what would be sent but don't send
@@ -1867,40 +2486,9 @@ class BackupEngine:
                     "Please add backup configuration to your config file."
                 )
 
-            # Convert Pydantic model to dict
-            config_dict = {
-                "enabled": backup_config.enabled,
-                "root": backup_config.root,
-                "retention_days": backup_config.retention_days,
-                "compression": backup_config.compression,
-            }
-
-            # Handle optional PBS config (also a Pydantic model)
-            if backup_config.proxmox_backup_server is not None:
-                pbs = backup_config.proxmox_backup_server
-                config_dict["proxmox_backup_server"] = {
-                    "enabled": pbs.enabled,
-                    "server": pbs.server,
-                    "port": pbs.port,
-                    "datastore": pbs.datastore,
-                    "username": pbs.username,
-                    "password": pbs.password,
-                    "password_command": pbs.password_command,
-                    "verify_ssl": pbs.verify_ssl,
-                }
-            else:
-                config_dict["proxmox_backup_server"] = None
-
-            # Handle optional direct storage config (also a Pydantic model)
-            if backup_config.direct_storage is not None:
-                ds = backup_config.direct_storage
-                config_dict["direct_storage"] = {
-                    "enabled": ds.enabled,
-                    "path": ds.path,
-                    "format": ds.format,
-                }
-            else:
-                config_dict["direct_storage"] = None
+            # Convert Pydantic model (and nested PBS/direct storage models)
+            # to plain dicts in one pass; Path values are kept as-is
+            config_dict = backup_config.model_dump()
 
             # Cache and return
             self._backup_config_cache = config_dict
@@ -5,12 +5,28 @@ This module provides YAML configuration loading, validation using Pydantic,
 and convenient dot-notation access to configuration values.
 """
 
+import copy
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import yaml
 from pydantic import (
     BaseModel,
+    BeforeValidator,
     ConfigDict,
     Field,
     ValidationError,
@@ -18,6 +34,87 @@ from pydantic import (
     model_validator,
 )
 
+# Prefer PyYAML's libyaml-backed loader; fall back to the pure-Python one
+# when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+@lru_cache(maxsize=64)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized on its path, modification time and size.
+
+    Repeat loads of an unchanged file (several loaders in one process, or a
+    reload) skip parsing. Editing the file changes mtime/size, so the stale
+    entry is never hit. Callers must not mutate the returned object.
+
+    mtime_ns and size are not read here; they only form part of the cache
+    key.
+    """
+    # pylint: disable=unused-argument
+    # Binary mode lets the YAML reader detect and decode the encoding itself
+    # (libyaml does it in C) instead of decoding through a text wrapper first
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
+def _lower_str(value: Any) -> Any:
+    """Lower-case strings so enum-like fields accept any input case."""
+    return value.lower() if isinstance(value, str) else value
+
+
+# Enum-like fields: case-insensitive input, membership checked by pydantic-core
+HypervisorType = Annotated[
+    Literal["proxmox", "esxi", "kvm"], BeforeValidator(_lower_str)
+]
+BackupFormat = Annotated[Literal["vma", "tar"], BeforeValidator(_lower_str)]
+NotificationType = Annotated[
+    Literal["email", "slack", "discord", "webhook"], BeforeValidator(_lower_str)
+]
+ServiceType = Annotated[
+    Literal["docker", "systemd", "vm", "lxc", "generic", "host"],
+    BeforeValidator(_lower_str),
+]
+
+
+@lru_cache(maxsize=256)
+def _compile_key(
+    key: str, max_depth: int
+) -> Tuple[Tuple[str, ...], Optional[Callable[[Any], Any]], str]:
+    """
+    Split a dotted config key into the pieces ConfigLoader.get() needs.
+
+    Memoized, so each key string is split, depth-checked and aliased once
+    per process and shared by every ConfigLoader.
+
+    Args:
+        key: Dot-separated key path (e.g., "global.hypervisor.type")
+        max_depth: Maximum number of key components allowed
+
+    Returns:
+        Tuple of (key path with 'global' aliased, attrgetter for the
+        parent path or None for top-level keys, leaf attribute name)
+
+    Raises:
+        ValueError: If key depth exceeds max_depth
+    """
+    keys = key.split(".")
+
+    if len(keys) > max_depth:
+        raise ValueError(
+            f"Dot notation depth exceeds maximum of {max_depth} levels: {key}"
+        )
+
+    # Handle 'global' alias mapping to 'global_config'
+    if keys[0] == "global":
+        keys[0] = "global_config"
+
+    parent_getter = attrgetter(".".join(keys[:-1])) if len(keys) > 1 else None
+    return tuple(keys), parent_getter, keys[-1]
+
 
 class ConfigError(Exception):
     """
@@ -31,9 +128,9 @@ class ConfigError(Exception):
 class HypervisorConfig(BaseModel):
     """Hypervisor configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
-    type: str = Field(..., description="Hypervisor type (e.g., 'proxmox')")
+    type: HypervisorType = Field(..., description="Hypervisor type (e.g., 'proxmox')")
     host: str = Field(..., description="Hypervisor hostname or IP")
     username: str = Field(..., description="Username for authentication")
     password: Optional[str] = Field(None, description="Password for authentication")
@@ -41,24 +138,15 @@ class HypervisorConfig(BaseModel):
     token_secret: Optional[str] = Field(None, description="API token secret")
     verify_ssl: bool = Field(True, description="Verify SSL certificates")
 
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        """Validate hypervisor type."""
-        allowed_types = ["proxmox", "esxi", "kvm"]
-        if v.lower() not in allowed_types:
-            raise ValueError(f"Hypervisor type must be one of {allowed_types}")
-        return v.lower()
-
 
 class ProxmoxBackupServerConfig(BaseModel):
     """Proxmox Backup Server configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = Field(False, description="Enable PBS integration")
     server: str = Field(..., description="PBS server hostname or IP")
-    port: int = Field(8007, description="PBS API port")
+    port: int = Field(8007, ge=1, le=65535, description="PBS API port")
     datastore: str = Field(..., description="PBS datastore name")
     username: str = Field(..., description="PBS username (e.g., root@pam)")
     password: Optional[str] = Field(None, description="PBS password")
@@ -67,14 +155,6 @@ class ProxmoxBackupServerConfig(BaseModel):
     )
     verify_ssl: bool = Field(True, description="Verify SSL certificates")
 
-    @field_validator("port")
-    @classmethod
-    def validate_port(cls, v: int) -> int:
-        """Validate port is in valid range."""
-        if v < 1 or v > 65535:
-            raise ValueError("Port must be between 1 and 65535")
-        return v
-
     @model_validator(mode="after")
     def validate_auth(self) -> "ProxmoxBackupServerConfig":
         """Ensure either password or password_command is provided."""
@@ -88,11 +168,11 @@ class ProxmoxBackupServerConfig(BaseModel):
 class DirectStorageConfig(BaseModel):
     """Direct storage backup configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = Field(False, description="Enable direct storage backups")
     path: Path = Field(..., description="Directory path for backups")
-    format: str = Field("vma", description="Backup format (vma or tar)")
+    format: BackupFormat = Field("vma", description="Backup format (vma or tar)")
 
     @field_validator("path")
     @classmethod
@@ -102,25 +182,19 @@ class DirectStorageConfig(BaseModel):
             raise ValueError("Direct storage path must be absolute")
         return v
 
-    @field_validator("format")
-    @classmethod
-    def validate_format(cls, v: str) -> str:
-        """Validate backup format."""
-        allowed_formats = ["vma", "tar"]
-        if v.lower() not in allowed_formats:
-            raise ValueError(f"Backup format must be one of {allowed_formats}")
-        return v.lower()
-
 
 class BackupConfig(BaseModel):
     """Backup configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = Field(True, description="Enable backups")
     root: Path = Field(..., description="Root directory for backups")
-    retention_days: int = Field(30, description="Days to retain backups")
+    retention_days: int = Field(30, ge=1, description="Days to retain backups")
     compression: bool = Field(True, description="Enable compression")
+    max_parallel: int = Field(
+        1, description="Maximum number of services backed up concurrently"
+    )
     proxmox_backup_server: Optional[ProxmoxBackupServerConfig] = Field(
         None, description="Proxmox Backup Server configuration"
     )
@@ -128,12 +202,12 @@ class BackupConfig(BaseModel):
         None, description="Direct storage backup configuration"
     )
 
-    @field_validator("retention_days")
+    @field_validator("max_parallel")
     @classmethod
-    def validate_retention(cls, v: int) -> int:
-        """Validate retention days is positive."""
+    def validate_max_parallel(cls, v: int) -> int:
+        """Validate parallel backup limit is positive."""
         if v < 1:
-            raise ValueError("Retention days must be at least 1")
+            raise ValueError("max_parallel must be at least 1")
         return v
 
     @field_validator("root")
@@ -148,63 +222,46 @@ class BackupConfig(BaseModel):
 class UpdateConfig(BaseModel):
     """Update configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = Field(True, description="Enable updates")
     auto_update: bool = Field(False, description="Automatically apply updates")
-    check_interval_hours: int = Field(24, description="Hours between update checks")
-
-    @field_validator("check_interval_hours")
-    @classmethod
-    def validate_interval(cls, v: int) -> int:
-        """Validate check interval is reasonable."""
-        if v < 1 or v > 168:  # Max 1 week
-            raise ValueError("Check interval must be between 1 and 168 hours")
-        return v
+    # Between 1 hour and 1 week
+    check_interval_hours: int = Field(
+        24, ge=1, le=168, description="Hours between update checks"
+    )
 
 
 class MonitoringConfig(BaseModel):
     """Monitoring configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = Field(True, description="Enable monitoring")
-    check_interval_minutes: int = Field(5, description="Minutes between health checks")
-
-    @field_validator("check_interval_minutes")
-    @classmethod
-    def validate_interval(cls, v: int) -> int:
-        """Validate check interval is reasonable."""
-        if v < 1 or v > 1440:  # Max 1 day
-            raise ValueError("Check interval must be between 1 and 1440 minutes")
-        return v
+    # Between 1 minute and 1 day
+    check_interval_minutes: int = Field(
+        5, ge=1, le=1440, description="Minutes between health checks"
+    )
 
 
 class NotificationConfig(BaseModel):
     """Notification configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     enabled: bool = Field(True, description="Enable notifications")
-    type: str = Field(..., description="Notification type (e.g., 'email', 'slack')")
+    type: NotificationType = Field(
+        ..., description="Notification type (e.g., 'email', 'slack')"
+    )
     settings: Dict[str, Any] = Field(
         default_factory=dict, description="Type-specific settings"
     )
 
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        """Validate notification type."""
-        allowed_types = ["email", "slack", "discord", "webhook"]
-        if v.lower() not in allowed_types:
-            raise ValueError(f"Notification type must be one of {allowed_types}")
-        return v.lower()
-
 
 class GlobalConfig(BaseModel):
     """Global configuration section."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     hypervisor: HypervisorConfig
     backup: BackupConfig
@@ -220,9 +277,18 @@ class ServiceConfig(BaseModel):
         extra="allow"
     )  # Allow extra fields for service-specific config
 
+    # Fields each service type must set, checked in order by
+    # validate_type_fields()
+    REQUIRED_FIELDS_BY_TYPE: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "vm": ("vmid", "node"),
+        "lxc": ("vmid", "node"),
+        "docker": ("container_name",),
+        "systemd": ("service_name",),
+    }
+
     # Core fields
     name: str = Field(..., description="Service name")
-    type: str = Field(
+    type: ServiceType = Field(
         ..., description="Service type (e.g., 'docker', 'systemd', 'vm', 'lxc')"
     )
     enabled: bool = Field(True, description="Enable this service")
@@ -231,7 +297,9 @@ class ServiceConfig(BaseModel):
     monitor: bool = Field(True, description="Include in monitoring")
 
     # Proxmox-specific fields (required for vm/lxc types)
-    vmid: Optional[int] = Field(None, description="Proxmox VM/LXC ID (100-999999)")
+    vmid: Optional[int] = Field(
+        None, ge=100, le=999999, description="Proxmox VM/LXC ID (100-999999)"
+    )
     node: Optional[str] = Field(None, description="Proxmox node name")
 
     # Docker-specific fields
@@ -248,60 +316,22 @@ class ServiceConfig(BaseModel):
         None, description="Additional paths to backup for host type"
     )
 
-    @field_validator("type")
-    @classmethod
-    def validate_type(cls, v: str) -> str:
-        """Validate service type."""
-        allowed_types = ["docker", "systemd", "vm", "lxc", "generic", "host"]
-        if v.lower() not in allowed_types:
-            raise ValueError(f"Service type must be one of {allowed_types}")
-        return v.lower()
-
-    @field_validator("vmid")
-    @classmethod
-    def validate_vmid(cls, v: Optional[int]) -> Optional[int]:
-        """Validate Proxmox VMID is in valid range."""
-        if v is not None and (v < 100 or v > 999999):
-            raise ValueError("Proxmox VMID must be between 100 and 999999")
-        return v
-
     @model_validator(mode="after")
-    def validate_proxmox_fields(self) -> "ServiceConfig":
-        """Ensure Proxmox services have required fields."""
-        if self.type in ["vm", "lxc"]:
-            if self.vmid is None:
+    def validate_type_fields(self) -> "ServiceConfig":
+        """Ensure the fields required by the service type are set."""
+        for field_name in self.REQUIRED_FIELDS_BY_TYPE.get(self.type, ()):
+            if getattr(self, field_name) is None:
                 raise ValueError(
-                    f"Service '{self.name}' of type '{self.type}' requires 'vmid' field"
+                    f"Service '{self.name}' of type '{self.type}' requires "
+                    f"'{field_name}' field"
                 )
-            if self.node is None:
-                raise ValueError(
-                    f"Service '{self.name}' of type '{self.type}' requires 'node' field"
-                )
-        return self
-
-    @model_validator(mode="after")
-    def validate_docker_fields(self) -> "ServiceConfig":
-        """Ensure Docker services have required fields."""
-        if self.type == "docker" and self.container_name is None:
-            raise ValueError(
-                f"Service '{self.name}' of type 'docker' requires 'container_name' field"
-            )
-        return self
-
-    @model_validator(mode="after")
-    def validate_systemd_fields(self) -> "ServiceConfig":
-        """Ensure systemd services have required fields."""
-        if self.type == "systemd" and self.service_name is None:
-            raise ValueError(
-                f"Service '{self.name}' of type 'systemd' requires 'service_name' field"
-            )
         return self
 
 
 class HomeLabConfig(BaseModel):
     """Root configuration model for Homelab Autopilot."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     # Use alias to handle 'global' reserved keyword
     global_config: GlobalConfig = Field(..., alias="global")
@@ -343,6 +373,8 @@ class ConfigLoader:
         self.merge_configs = merge_configs or []
         self._raw_config: Dict[str, Any] = {}
         self._validated_config: Optional[HomeLabConfig] = None
+        # Service name -> ServiceConfig, built after validation
+        self._service_index: Dict[str, ServiceConfig] = {}
 
         self._load_and_validate()
 
@@ -360,60 +392,68 @@ class ConfigLoader:
             FileNotFoundError: If file doesn't exist
             ValueError: If YAML parsing fails or content is not a dictionary
         """
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {path}")
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {path}") from None
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = yaml.safe_load(f)
-                if content is None:
-                    return {}
-                if not isinstance(content, dict):
-                    raise ValueError(
-                        f"Configuration must be a YAML dictionary in {path}, "
-                        f"got {type(content).__name__}"
-                    )
-                return content
+            content = _parse_yaml_file(str(path.absolute()), st.st_mtime_ns, st.st_size)
         except yaml.YAMLError as e:
             raise ValueError(f"Failed to parse YAML file {path}: {e}") from e
 
+        if content is None:
+            return {}
+        if not isinstance(content, dict):
+            raise ValueError(
+                f"Configuration must be a YAML dictionary in {path}, "
+                f"got {type(content).__name__}"
+            )
+        # The parsed dict is shared through the cache; merging mutates it
+        return copy.deepcopy(content)
+
     def _merge_configs(
         self, base: Dict[str, Any], override: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Recursively merge two configuration dictionaries.
+        Merge an override configuration dictionary into a base one.
 
         Later values override earlier ones. Lists are replaced, not merged,
         EXCEPT for the 'services' list which is appended.
 
+        The merge walks nested dictionaries with an explicit stack instead
+        of recursing, and updates base in place. Only the nested dicts and
+        lists it changes are copied, since YAML anchors can make several
+        keys share one object.
+
         Args:
-            base: Base configuration dictionary
+            base: Base configuration dictionary (modified in place)
             override: Override configuration dictionary
 
         Returns:
-            Merged configuration dictionary
+            The merged base dictionary
         """
-        result = base.copy()
-
-        for key, value in override.items():
-            if key == "services" and isinstance(value, list):
-                # Special case: append services instead of replacing
-                if key in result and isinstance(result[key], list):
-                    result[key] = result[key] + value
+        stack = [(base, override)]
+
+        while stack:
+            result, changes = stack.pop()
+            for key, value in changes.items():
+                current = result.get(key)
+                if key == "services" and isinstance(value, list):
+                    # Special case: append services instead of replacing
+                    if isinstance(current, list):
+                        result[key] = current + value
+                    else:
+                        result[key] = value
+                elif isinstance(current, dict) and isinstance(value, dict):
+                    # Merge nested dictionaries on a later pass
+                    nested = result[key] = current.copy()
+                    stack.append((nested, value))
                 else:
+                    # Override or add new key (including list replacement)
                     result[key] = value
-            elif (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                # Recursively merge nested dictionaries
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                # Override or add new key (including list replacement)
-                result[key] = value
 
-        return result
+        return base
 
     def _load_and_validate(self) -> None:
         """
@@ -434,20 +474,28 @@ class ConfigLoader:
         try:
             self._validated_config = HomeLabConfig.model_validate(self._raw_config)
         except ValidationError as e:
-            # Re-raise as ConfigError with helpful context
-            error_count = len(e.errors())
-            error_msg = (
-                f"Configuration validation failed with {error_count} error(s):\n"
-            )
-            for error in e.errors():
+            # Re-raise as ConfigError with helpful context; errors() builds a
+            # new list on every call, so fetch it once
+            errors = e.errors()
+            error_lines = [
+                f"Configuration validation failed with {len(errors)} error(s):"
+            ]
+            for error in errors:
                 loc = ".".join(str(l) for l in error["loc"])
-                error_msg += f"  - {loc}: {error['msg']}\n"
-            raise ConfigError(error_msg) from e
+                error_lines.append(f"  - {loc}: {error['msg']}")
+            raise ConfigError("\n".join(error_lines) + "\n") from e
+
+        # Index services by name; the first definition of a name wins, as
+        # with the previous list scan
+        service_index: Dict[str, ServiceConfig] = {}
+        for service in self._validated_config.services:
+            service_index.setdefault(service.name, service)
+        self._service_index = service_index
 
     def _get_nested_value(
         self,
         data: Union[Dict[str, Any], BaseModel],
-        keys: List[str],
+        keys: Sequence[str],
         default: Any = None,
     ) -> Any:
         """
@@ -514,18 +562,23 @@ class ConfigLoader:
                 )
             return default
 
-        keys = key.split(".")
-
-        if len(keys) > self.MAX_DOT_DEPTH:
-            raise ValueError(
-                f"Dot notation depth exceeds maximum of {self.MAX_DOT_DEPTH} levels: {key}"
-            )
+        keys, parent_getter, leaf = _compile_key(key, self.MAX_DOT_DEPTH)
 
-        # Handle 'global' alias mapping to 'global_config'
-        if keys[0] == "global":
-            keys[0] = "global_config"
+        # Fast path: one C-level attrgetter to the parent, then a plain
+        # getattr when the parent is a model. Paths into dicts or other
+        # objects fall back to the generic walk, which defines the semantics.
+        if parent_getter is None:
+            parent = self._validated_config
+        else:
+            try:
+                parent = parent_getter(self._validated_config)
+            except AttributeError:
+                parent = None
 
-        value = self._get_nested_value(self._validated_config, keys, default)
+        if isinstance(parent, BaseModel):
+            value = getattr(parent, leaf, default)
+        else:
+            value = self._get_nested_value(self._validated_config, keys, default)
 
         # If required and value is None or equals default, raise error
         if required and value is None:
@@ -584,11 +637,7 @@ class ConfigLoader:
             ...     print(service.type)
             'docker'
         """
-        services = self.get_array("services")
-        for service in services:
-            if isinstance(service, ServiceConfig) and service.name == service_name:
-                return service
-        return None
+        return self._service_index.get(service_name)
 
     def get_all_services(self) -> List[ServiceConfig]:
         """
@@ -597,7 +646,9 @@ class ConfigLoader:
         Returns:
             List of ServiceConfig objects
         """
-        return self.get_array("services")
+        if not self._validated_config:
+            return []
+        return self._validated_config.services
 
     def get_raw_config(self) -> Dict[str, Any]:
         """
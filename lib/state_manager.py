@@ -7,11 +7,82 @@ such as last backup times, update times, and notification cooldowns.
 
 import json
 import sqlite3
+import sys
 import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+# Statements are kept as constants so every call passes the identical string
+# and hits the connection's prepared-statement cache
+_SQL_CREATE = """
+    CREATE TABLE IF NOT EXISTS state (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        type TEXT NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+_SQL_GET = "SELECT value, type FROM state WHERE key = ?"
+_SQL_SET = """
+    INSERT OR REPLACE INTO state (key, value, type, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+"""
+_SQL_DELETE = "DELETE FROM state WHERE key = ?"
+_SQL_EXISTS = "SELECT 1 FROM state WHERE key = ? LIMIT 1"
+_SQL_GET_ALL = "SELECT key, value, type FROM state"
+_SQL_CLEAR = "DELETE FROM state"
+_SQL_KEYS = "SELECT key FROM state"
+# Prefix matches are range scans on the primary key index
+_SQL_KEYS_RANGE = "SELECT key FROM state WHERE key >= ? AND key < ?"
+_SQL_KEYS_FROM = "SELECT key FROM state WHERE key >= ?"
+
+# Encoder for each exact value type; subclasses (IntEnum, OrderedDict, ...)
+# fall back to the isinstance() checks in StateManager._serialize_value()
+_ENCODERS: Dict[type, Callable[[Any], tuple[str, str]]] = {
+    type(None): lambda value: ("null", "none"),
+    bool: lambda value: (str(value), "bool"),
+    int: lambda value: (str(value), "int"),
+    float: lambda value: (str(value), "float"),
+    str: lambda value: (value, "str"),
+    datetime: lambda value: (value.isoformat(), "datetime"),
+    dict: lambda value: (json.dumps(value), "json"),
+    list: lambda value: (json.dumps(value), "json"),
+}
+
+# Decoder for each type name stored in the ``type`` column
+_DECODERS: Dict[str, Callable[[str], Any]] = {
+    "none": lambda value_str: None,
+    "bool": lambda value_str: value_str == "True",
+    "int": int,
+    "float": float,
+    "str": str,
+    "datetime": datetime.fromisoformat,
+    "json": json.loads,
+}
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Return the smallest string greater than every string starting with prefix.
+
+    Args:
+        prefix: Key prefix
+
+    Returns:
+        Exclusive upper bound for the prefix range, or None if no such
+        string exists (the prefix is empty or all maximal code points)
+    """
+    while prefix:
+        next_code = ord(prefix[-1]) + 1
+        if next_code <= sys.maxunicode:
+            # Surrogates cannot be encoded to UTF-8 for SQLite
+            if 0xD800 <= next_code <= 0xDFFF:
+                next_code = 0xE000
+            return prefix[:-1] + chr(next_code)
+        prefix = prefix[:-1]
+    return None
 
 
 class StateError(Exception):
@@ -56,7 +127,7 @@ class StateManager:
         """
         self.db_path = db_path
         self.timeout = timeout
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
 
         # Ensure database directory exists
         try:
@@ -66,51 +137,117 @@ class StateManager:
                 f"Failed to create database directory {db_path.parent}: {e}"
             ) from e
 
+        # One connection for the lifetime of the instance, shared by all
+        # threads under self._lock
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._conn = self._connect()
+        except sqlite3.Error as e:
+            raise StateError(f"Database connection failed for {db_path}: {e}") from e
+
         # Initialize database
-        self._init_database()
+        try:
+            self._init_database()
+        except StateError:
+            self.close()
+            raise
+
+    def __enter__(self) -> "StateManager":
+        """Return self so the manager can be used in a ``with`` block."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the database connection on leaving the ``with`` block."""
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a database connection with per-connection pragmas applied.
+
+        With the WAL journal set up by ``_init_database()``, synchronous=NORMAL
+        only fsyncs at checkpoints instead of on every commit, and a crash can
+        lose at most the last commits, never corrupt the database.
+
+        Returns:
+            sqlite3.Connection: New database connection
+
+        Raises:
+            sqlite3.Error: If the connection cannot be opened
+        """
+        # Access is serialized by self._lock, so the connection may be used
+        # from any thread
+        conn = sqlite3.connect(
+            str(self.db_path), timeout=self.timeout, check_same_thread=False
+        )
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+
+        Safe to call more than once. Any later operation raises StateError.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     @contextmanager
     def _get_connection(self):
         """
-        Get database connection with timeout as context manager.
+        Get the shared database connection as context manager.
+
+        The connection is opened once in ``__init__`` and kept until
+        ``close()``, so the schema, page cache and compiled statements survive
+        between calls. Callers must hold ``self._lock``.
 
         Yields:
             sqlite3.Connection: Database connection
 
         Raises:
-            StateError: If connection fails
+            StateError: If the connection has been closed
+        """
+        if self._conn is None:
+            raise StateError(f"Database connection for {self.db_path} is closed")
+
+        yield self._conn
+
+    def _rollback(self) -> None:
         """
+        Roll back a failed write.
+
+        The connection outlives the call, so a write that failed mid-way
+        (e.g. "database is locked") would otherwise leave it inside an open
+        transaction: later reads would see a stale snapshot and later writes
+        would keep failing.
+        """
+        if self._conn is None:
+            return
         try:
-            conn = sqlite3.connect(str(self.db_path), timeout=self.timeout)
-            try:
-                yield conn
-            finally:
-                conn.close()
-        except sqlite3.Error as e:
-            raise StateError(
-                f"Database connection failed for {self.db_path}: {e}"
-            ) from e
+            self._conn.rollback()
+        except sqlite3.Error:
+            # The original error is the one worth reporting
+            pass
 
     def _init_database(self) -> None:
         """
         Create database schema if it doesn't exist.
 
+        Also switches the database to WAL journaling. The setting is stored in
+        the database file, so readers no longer block behind a writer and
+        every later connection uses it.
+
         Raises:
             StateError: If database initialization fails
         """
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    conn.execute(
-                        """
-                        CREATE TABLE IF NOT EXISTS state (
-                            key TEXT PRIMARY KEY,
-                            value TEXT NOT NULL,
-                            type TEXT NOT NULL,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """
-                    )
+                    # Returns the resulting mode; filesystems without shared
+                    # memory support keep the default rollback journal
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(_SQL_CREATE)
                     conn.commit()
             except StateError:
                 raise
@@ -155,12 +292,13 @@ class StateManager:
         Raises:
             TypeError: If value type is not supported
         """
-        if value is None:
-            return ("null", "none")
-        elif isinstance(value, bool):
-            # Must check bool before int (bool is subclass of int)
-            return (str(value), "bool")
-        elif isinstance(value, int):
+        encode = _ENCODERS.get(type(value))
+        if encode is not None:
+            return encode(value)
+
+        # Subclasses of the supported types; bool cannot be subclassed, so
+        # it never reaches the int check here
+        if isinstance(value, int):
             return (str(value), "int")
         elif isinstance(value, float):
             return (str(value), "float")
@@ -187,22 +325,11 @@ class StateManager:
         Raises:
             ValueError: If deserialization fails
         """
-        if type_name == "none":
-            return None
-        elif type_name == "bool":
-            return value_str == "True"
-        elif type_name == "int":
-            return int(value_str)
-        elif type_name == "float":
-            return float(value_str)
-        elif type_name == "str":
-            return value_str
-        elif type_name == "datetime":
-            return datetime.fromisoformat(value_str)
-        elif type_name == "json":
-            return json.loads(value_str)
-        else:
-            raise ValueError(f"Unknown type in database: {type_name}")
+        try:
+            decode = _DECODERS[type_name]
+        except KeyError:
+            raise ValueError(f"Unknown type in database: {type_name}") from None
+        return decode(value_str)
 
     def get(self, key: str, default: Optional[Any] = None) -> Optional[Any]:
         """
@@ -227,9 +354,7 @@ class StateManager:
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    cursor = conn.execute(
-                        "SELECT value, type FROM state WHERE key = ?", (key,)
-                    )
+                    cursor = conn.execute(_SQL_GET, (key,))
                     row = cursor.fetchone()
 
                     if row is None:
@@ -270,19 +395,58 @@ class StateManager:
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    conn.execute(
-                        """
-                        INSERT OR REPLACE INTO state (key, value, type, updated_at)
-                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                        """,
-                        (key, value_str, type_name),
-                    )
+                    conn.execute(_SQL_SET, (key, value_str, type_name))
                     conn.commit()
             except StateError:
                 raise
             except sqlite3.Error as e:
+                self._rollback()
                 raise StateError(f"Failed to set key '{key}': {e}") from e
 
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """
+        Set several keys in a single transaction.
+
+        Equivalent to calling set() for each item, but issues one
+        executemany and one commit instead of one per key.
+
+        Args:
+            items: Mapping of key -> value (values must be serializable)
+
+        Raises:
+            TypeError: If any value type is not supported (nothing is written)
+            StateError: If database operation fails
+
+        Example:
+            >>> state.set_many({
+            ...     "backup_status.plex": "success",
+            ...     "backup_path.plex": "/mnt/backups/plex.tar.gz",
+            ... })
+        """
+        rows = []
+        for key, value in items.items():
+            try:
+                value_str, type_name = self._serialize_value(value)
+            except TypeError as e:
+                raise TypeError(
+                    f"Failed to serialize value for key '{key}': {e}"
+                ) from e
+            rows.append((key, value_str, type_name))
+
+        if not rows:
+            return
+
+        with self._lock:
+            try:
+                with self._get_connection() as conn:
+                    conn.executemany(_SQL_SET, rows)
+                    conn.commit()
+            except StateError:
+                raise
+            except sqlite3.Error as e:
+                self._rollback()
+                raise StateError(f"Failed to set {len(rows)} keys: {e}") from e
+
     def delete(self, key: str) -> None:
         """
         Delete key from state.
@@ -301,11 +465,12 @@ class StateManager:
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    conn.execute("DELETE FROM state WHERE key = ?", (key,))
+                    conn.execute(_SQL_DELETE, (key,))
                     conn.commit()
             except StateError:
                 raise
             except sqlite3.Error as e:
+                self._rollback()
                 raise StateError(f"Failed to delete key '{key}': {e}") from e
 
     def exists(self, key: str) -> bool:
@@ -328,9 +493,7 @@ class StateManager:
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    cursor = conn.execute(
-                        "SELECT 1 FROM state WHERE key = ? LIMIT 1", (key,)
-                    )
+                    cursor = conn.execute(_SQL_EXISTS, (key,))
                     return cursor.fetchone() is not None
             except StateError:
                 raise
@@ -355,11 +518,13 @@ class StateManager:
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    cursor = conn.execute("SELECT key, value, type FROM state")
-                    result = {}
-                    for key, value_str, type_name in cursor.fetchall():
-                        result[key] = self._deserialize_value(value_str, type_name)
-                    return result
+                    deserialize = self._deserialize_value
+                    # Iterate the cursor directly instead of building a
+                    # fetchall() list of raw rows first
+                    return {
+                        key: deserialize(value_str, type_name)
+                        for key, value_str, type_name in conn.execute(_SQL_GET_ALL)
+                    }
             except StateError:
                 raise
             except (sqlite3.Error, ValueError) as e:
@@ -380,17 +545,21 @@ class StateManager:
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    conn.execute("DELETE FROM state")
+                    conn.execute(_SQL_CLEAR)
                     conn.commit()
             except StateError:
                 raise
             except sqlite3.Error as e:
+                self._rollback()
                 raise StateError(f"Failed to clear state: {e}") from e
 
     def get_keys(self, prefix: Optional[str] = None) -> list[str]:
         """
         Get all keys, optionally filtered by prefix.
 
+        The prefix is matched literally and case-sensitively, as a range
+        scan on the key index.
+
         Args:
             prefix: Optional prefix to filter keys (e.g., "backup.")
 
@@ -408,11 +577,13 @@ class StateManager:
             try:
                 with self._get_connection() as conn:
                     if prefix:
-                        cursor = conn.execute(
-                            "SELECT key FROM state WHERE key LIKE ?", (f"{prefix}%",)
-                        )
+                        upper = _prefix_upper_bound(prefix)
+                        if upper is None:
+                            cursor = conn.execute(_SQL_KEYS_FROM, (prefix,))
+                        else:
+                            cursor = conn.execute(_SQL_KEYS_RANGE, (prefix, upper))
                     else:
-                        cursor = conn.execute("SELECT key FROM state")
+                        cursor = conn.execute(_SQL_KEYS)
 
                     return [row[0] for row in cursor.fetchall()]
             except StateError:
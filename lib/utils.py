@@ -5,10 +5,26 @@ This module provides common helper functions used throughout the project
 for path operations, date/time handling, formatting, and validation.
 """
 
+import math
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
+
+# Characters invalid in Windows/Linux filenames, including ASCII controls
+_INVALID_FILENAME_CHARS = '<>:"/\\|?*' + "".join(map(chr, range(0x20)))
+
+# Alphanumeric, hyphens and underscores per label, labels joined by dots
+_HOSTNAME_RE = re.compile(
+    r"^[a-zA-Z0-9]([a-zA-Z0-9\-_]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-_]{0,61}[a-zA-Z0-9])?)*$"
+)
+
+# Largest unit first; seconds are appended separately
+_DURATION_UNITS = ((86400, "d"), (3600, "h"), (60, "m"))
+
+# Each unit is 1024 (2**10) times the previous one
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 # Path Operations
 
@@ -34,7 +50,7 @@ def validate_path(
     if not path:
         raise ValueError("Path cannot be empty")
 
-    path_obj = Path(path)
+    path_obj = path if isinstance(path, Path) else Path(path)
 
     if must_be_absolute and not path_obj.is_absolute():
         raise ValueError(f"Path must be absolute: {path}")
@@ -80,7 +96,7 @@ def safe_remove(path: Union[str, Path], missing_ok: bool = True) -> bool:
         FileNotFoundError: If missing_ok=False and path doesn't exist
         OSError: If removal fails for other reasons
     """
-    path_obj = Path(path)
+    path_obj = path if isinstance(path, Path) else Path(path)
 
     if not path_obj.exists():
         if missing_ok:
@@ -150,19 +166,13 @@ def human_readable_duration(seconds: Union[int, float]) -> str:
 
     seconds = int(seconds)
 
-    days, remainder = divmod(seconds, 86400)
-    hours, remainder = divmod(remainder, 3600)
-    minutes, secs = divmod(remainder, 60)
-
     parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if secs > 0 or not parts:
-        parts.append(f"{secs}s")
+    for unit_seconds, suffix in _DURATION_UNITS:
+        count, seconds = divmod(seconds, unit_seconds)
+        if count:
+            parts.append(f"{count}{suffix}")
+    if seconds or not parts:
+        parts.append(f"{seconds}s")
 
     return " ".join(parts)
 
@@ -190,15 +200,34 @@ def format_bytes(bytes_value: Union[int, float], precision: int = 2) -> str:
     if bytes_value < 0:
         raise ValueError("Bytes value cannot be negative")
 
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    size = float(bytes_value)
-    unit_index = 0
+    # int() rejects inf/nan; keep what the old division loop produced
+    # ("inf PB", "nan B")
+    if not math.isfinite(bytes_value):
+        unit = _BYTE_UNITS[-1] if bytes_value > 0 else _BYTE_UNITS[0]
+        return f"{bytes_value:.{precision}f} {unit}"
+
+    # Every 10 bits of the integer part is one unit step; the thresholds
+    # are integers, so truncating a float does not change the unit
+    magnitude = max(int(bytes_value), 1).bit_length() - 1
+    unit_index = min(magnitude // 10, len(_BYTE_UNITS) - 1)
+    # Dividing by a power of two is exact, matching repeated / 1024.0
+    size = bytes_value / (1 << (10 * unit_index))
+
+    return f"{size:.{precision}f} {_BYTE_UNITS[unit_index]}"
 
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
 
-    return f"{size:.{precision}f} {units[unit_index]}"
+@lru_cache(maxsize=8)
+def _filename_translation(replacement: str) -> Dict[int, str]:
+    """
+    Build the str.translate() table mapping invalid filename characters.
+
+    Args:
+        replacement: String substituted for each invalid character
+
+    Returns:
+        Translation table keyed by code point
+    """
+    return dict.fromkeys(map(ord, _INVALID_FILENAME_CHARS), replacement)
 
 
 def sanitize_filename(name: str, replacement: str = "_") -> str:
@@ -219,9 +248,8 @@ def sanitize_filename(name: str, replacement: str = "_") -> str:
     if not name:
         raise ValueError("Filename cannot be empty")
 
-    # Remove invalid characters for Windows/Linux filesystems
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    sanitized = re.sub(invalid_chars, replacement, name)
+    # Replace invalid characters for Windows/Linux filesystems
+    sanitized = name.translate(_filename_translation(replacement))
 
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip(". ")
@@ -276,7 +304,4 @@ def is_valid_hostname(hostname: str) -> bool:
     if not hostname or len(hostname) > 253:
         return False
 
-    # Allow alphanumeric, hyphens, dots, underscores
-    # Each label between dots should be valid
-    pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9\-_]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-_]{0,61}[a-zA-Z0-9])?)*$"
-    return bool(re.match(pattern, hostname))
+    return _HOSTNAME_RE.match(hostname) is not None
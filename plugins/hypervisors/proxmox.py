@@ -6,7 +6,9 @@ and containers via the Proxmox VE API. Supports both Proxmox Backup Server (PBS)
 integration and direct storage backups.
 """
 
+import hashlib
 import time
+import weakref
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -18,6 +20,33 @@ from lib.logger import get_logger
 from lib.state_manager import StateManager
 from plugins.base import HypervisorPlugin
 
+# Authenticated API clients shared by every plugin instance in the process,
+# keyed by a fingerprint of the connection settings. Entries disappear once
+# no plugin references the client, so stale credentials are not kept alive.
+_API_CLIENT_POOL: "weakref.WeakValueDictionary[str, ProxmoxAPI]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _api_client_key(host: str, username: str, password: str, verify_ssl: Any) -> str:
+    """
+    Build the pool key for a set of Proxmox connection settings.
+
+    The password is hashed together with the other settings so it is never
+    stored in the key itself.
+
+    Args:
+        host: Proxmox API host
+        username: Proxmox username
+        password: Proxmox password
+        verify_ssl: SSL verification setting
+
+    Returns:
+        Hex digest identifying the connection settings
+    """
+    fingerprint = "\0".join((host, username, password, str(verify_ssl)))
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
 
 class ProxmoxPlugin(HypervisorPlugin):
     """
@@ -82,8 +111,9 @@ class ProxmoxPlugin(HypervisorPlugin):
         """
         Get or create Proxmox API client.
 
-        Creates a new client on first call and caches it for reuse.
-        Retrieves connection parameters from global hypervisor config.
+        Creates a new client on first call and caches it for reuse. Clients
+        are also shared between plugin instances that use the same connection
+        settings. Retrieves connection parameters from global hypervisor config.
 
         Returns:
             Proxmox API client instance
@@ -105,6 +135,15 @@ class ProxmoxPlugin(HypervisorPlugin):
             )
             verify_ssl = self.config_loader.get("global.hypervisor.verify_ssl", True)
 
+            # Reuse a client (auth ticket, TLS session) already opened with the
+            # same settings, e.g. by a previous engine after a config reload
+            pool_key = _api_client_key(host, username, password, verify_ssl)
+            client = _API_CLIENT_POOL.get(pool_key)
+            if client is not None:
+                self.logger.debug(f"Reusing pooled Proxmox API client for {host}")
+                self._api_client = client
+                return client
+
             self.logger.debug(f"Connecting to Proxmox API at {host}")
 
             # Create and cache the API client
@@ -114,6 +153,7 @@ class ProxmoxPlugin(HypervisorPlugin):
                 password=password,
                 verify_ssl=verify_ssl,
             )
+            _API_CLIENT_POOL[pool_key] = self._api_client
 
             self.logger.debug("Proxmox API client initialized successfully")
             return self._api_client
@@ -249,7 +289,7 @@ class ProxmoxPlugin(HypervisorPlugin):
             ConnectionError: If unable to query task status
         """
         api = self._get_api_client()
-        start_time = time.time()
+        start_time = time.monotonic()
         last_log_time = start_time
 
         self.logger.info(f"Waiting for task {upid} on node {node}")
@@ -257,7 +297,7 @@ class ProxmoxPlugin(HypervisorPlugin):
         try:
             while True:
                 # Check timeout
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed > timeout:
                     self.logger.error(f"Task {upid} timed out after {timeout} seconds")
                     return False
@@ -268,11 +308,11 @@ class ProxmoxPlugin(HypervisorPlugin):
                 # Check if task is still running
                 if status.get("status") == "running":
                     # Log progress every 30 seconds
-                    if time.time() - last_log_time >= 30:
+                    if time.monotonic() - last_log_time >= 30:
                         self.logger.debug(
                             f"Task {upid} still running... ({int(elapsed)}s elapsed)"
                         )
-                        last_log_time = time.time()
+                        last_log_time = time.monotonic()
 
                     time.sleep(2)
                     continue
@@ -0,0 +1,175 @@
+"""
+Tests for BackupEngine._apply_retention_policy() method.
+
+Tests cover:
+- Selecting files older than retention_days
+- Disabled retention
+- Reusing mtimes from the directory listing
+- Always keeping the newest backup
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from core.backup_engine import BackupEngine
+from core.config_loader import ConfigLoader
+from lib.state_manager import StateManager
+
+DAY = 24 * 60 * 60
+
+
+# Fixtures
+@pytest.fixture
+def backup_engine_temp(tmp_path):
+    """Return BackupEngine with temp backup directory and 30-day retention."""
+    config_file = tmp_path / "config.yaml"
+    backup_root = tmp_path / "backups"
+
+    config_file.write_text(
+        f"""
+global:
+  hypervisor:
+    type: proxmox
+    host: localhost
+    username: admin
+  backup:
+    root: {backup_root}
+    retention_days: 30
+  notification:
+    type: email
+    settings:
+      smtp_host: localhost
+
+services:
+  - name: test
+    type: lxc
+    vmid: 100
+    node: pve
+"""
+    )
+
+    config = ConfigLoader(config_file)
+    state = StateManager(tmp_path / "test_state.db")
+    return BackupEngine(config, state)
+
+
+def create_backup(backup_dir: Path, name: str, days_old: int) -> Path:
+    """Create a backup file with a modification time days_old days ago."""
+    file_path = backup_dir / name
+    file_path.write_bytes(b"test backup content")
+    old_time = time.time() - days_old * DAY
+    os.utime(file_path, (old_time, old_time))
+    return file_path
+
+
+class TestApplyRetentionPolicy:
+    """Test BackupEngine._apply_retention_policy() method."""
+
+    def test_returns_only_expired_files_oldest_first(self, backup_engine_temp):
+        """Test that only files older than retention_days are returned."""
+        engine = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+
+        oldest = create_backup(backup_dir, "oldest.tar.gz", days_old=60)
+        old = create_backup(backup_dir, "old.tar.gz", days_old=31)
+        create_backup(backup_dir, "recent.tar.gz", days_old=29)
+        create_backup(backup_dir, "new.tar.gz", days_old=0)
+
+        assert engine._apply_retention_policy("test") == [oldest, old]
+
+    def test_no_expired_files_returns_empty_list(self, backup_engine_temp):
+        """Test that nothing is returned when all files are within retention."""
+        engine = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+
+        create_backup(backup_dir, "recent.tar.gz", days_old=1)
+
+        assert engine._apply_retention_policy("test") == []
+
+    def test_empty_directory_returns_empty_list(self, backup_engine_temp):
+        """Test that an empty backup directory returns an empty list."""
+        assert backup_engine_temp._apply_retention_policy("test") == []
+
+    def test_retention_disabled_returns_empty_list(self, backup_engine_temp):
+        """Test that retention_days=None disables the policy."""
+        engine = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+        create_backup(backup_dir, "ancient.tar.gz", days_old=365)
+
+        engine._backup_config_cache = dict(
+            engine._get_backup_config(), retention_days=None
+        )
+
+        assert engine._apply_retention_policy("test") == []
+
+    def test_does_not_stat_files_again(self, backup_engine_temp, monkeypatch):
+        """Test that mtimes from the directory listing are reused."""
+        engine = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+        expired = create_backup(backup_dir, "expired.tar.gz", days_old=40)
+        create_backup(backup_dir, "recent.tar.gz", days_old=1)
+
+        def fail_stat(*args, **kwargs):
+            raise AssertionError("Path.stat called during retention check")
+
+        monkeypatch.setattr(Path, "stat", fail_stat)
+
+        assert engine._apply_retention_policy("test") == [expired]
+
+    def test_file_stats_carry_size_and_mtime(self, backup_engine_temp):
+        """Test that listed stat results expose size and mtime for reuse."""
+        engine = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+        expired = create_backup(backup_dir, "expired.tar.gz", days_old=40)
+
+        [(path, st)] = engine._get_backup_file_stats("test")
+
+        assert path == expired
+        assert st.st_size == len(b"test backup content")
+        assert st.st_mtime < time.time() - 30 * DAY
+
+    def test_file_exactly_at_cutoff_is_kept(self, backup_engine_temp, monkeypatch):
+        """Test that the bisect cutoff only expires files strictly older."""
+        engine = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+        # Whole seconds so the mtimes round-trip through utime exactly
+        now = float(int(time.time()))
+        cutoff = now - 30 * DAY
+
+        older = backup_dir / "older.tar.gz"
+        at_cutoff = backup_dir / "at_cutoff.tar.gz"
+        for file_path, mtime in ((older, cutoff - 1), (at_cutoff, cutoff)):
+            file_path.write_bytes(b"test backup content")
+            os.utime(file_path, (mtime, mtime))
+
+        monkeypatch.setattr("core.backup_engine.time.time", lambda: now)
+
+        assert engine._apply_retention_policy("test") == [older]
+
+    def test_newest_backup_kept_when_all_expired(self, backup_engine_temp):
+        """Test that the newest backup survives even when past the cutoff."""
+        engine = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+
+        oldest = create_backup(backup_dir, "oldest.tar.gz", days_old=90)
+        old = create_backup(backup_dir, "old.tar.gz", days_old=60)
+        create_backup(backup_dir, "newest.tar.gz", days_old=45)
+
+        assert engine._apply_retention_policy("test") == [oldest, old]
+
+    def test_min_backups_to_keep_zero_expires_everything(
+        self, backup_engine_temp, monkeypatch
+    ):
+        """Test that MIN_BACKUPS_TO_KEEP=0 disables the newest-backup guard."""
+        engine = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+
+        old = create_backup(backup_dir, "old.tar.gz", days_old=60)
+        newest = create_backup(backup_dir, "newest.tar.gz", days_old=45)
+
+        monkeypatch.setattr(engine, "MIN_BACKUPS_TO_KEEP", 0)
+
+        assert engine._apply_retention_policy("test") == [old, newest]
@@ -254,6 +254,25 @@ class TestExecuteBackupCommandPBS:
         assert "PBS connection timeout" in result["error_message"]
         assert result["backup_path"] is None
 
+    def test_plugin_exception_logged_with_traceback(
+        self, backup_engine, vm_service, pbs_destination, mock_metadata
+    ):
+        """Test plugin exceptions are logged via logger.exception."""
+        mock_plugin = Mock()
+        mock_plugin.backup_to_pbs.side_effect = RuntimeError("PBS connection timeout")
+
+        with patch.object(
+            backup_engine, "_get_plugin_for_service", return_value=mock_plugin
+        ):
+            with patch.object(backup_engine, "logger") as mock_logger:
+                backup_engine._execute_backup_command(
+                    vm_service, pbs_destination, mock_metadata
+                )
+
+        mock_logger.exception.assert_called_once_with(
+            "Backup failed for service '{}'", vm_service.name
+        )
+
 
 class TestExecuteBackupCommandDirect:
     """Test direct storage backup execution."""
@@ -416,6 +435,31 @@ class TestExecuteBackupCommandLocal:
         assert "Permission denied" in result["error_message"]
 
 
+class TestExecuteBackupCommandDispatch:
+    """Test method dispatch through the executor table."""
+
+    def test_executor_table_covers_all_methods(self, backup_engine):
+        """Test every backup method has an executor."""
+        assert set(backup_engine._backup_executors) == {"pbs", "direct", "local"}
+
+    def test_unknown_method_returns_failure(
+        self, backup_engine, docker_service, mock_metadata
+    ):
+        """Test a method with no executor fails without calling the plugin."""
+        mock_plugin = Mock()
+
+        with patch.object(
+            backup_engine, "_get_plugin_for_service", return_value=mock_plugin
+        ):
+            result = backup_engine._execute_backup_command(
+                docker_service, {"method": "tape"}, mock_metadata
+            )
+
+        assert result["success"] is False
+        assert "Unknown backup method 'tape'" in result["error_message"]
+        assert not mock_plugin.method_calls
+
+
 class TestExecuteBackupCommandDryRun:
     """Test dry run mode for all backup methods."""
 
@@ -450,6 +494,18 @@ class TestExecuteBackupCommandDryRun:
         # Duration should be minimal
         assert result["duration_seconds"] < 1
 
+    def test_dry_run_reports_fixed_duration_without_clock(
+        self, backup_engine_dry_run, docker_service, local_destination, mock_metadata
+    ):
+        """Test dry run reports the fixed mock duration without timing anything."""
+        with patch("core.backup_engine.time.monotonic") as mock_time:
+            result = backup_engine_dry_run._execute_backup_command(
+                docker_service, local_destination, mock_metadata
+            )
+
+        assert result["duration_seconds"] == BackupEngine.DRY_RUN_DURATION_SECONDS
+        mock_time.assert_not_called()
+
     def test_dry_run_direct_backup(
         self,
         backup_engine_dry_run,
@@ -10,6 +10,8 @@ Tests cover:
 - Edge cases (exceptions caught, ConfigLoader failures, large service counts)
 """
 
+import asyncio
+import threading
 from pathlib import Path
 from unittest.mock import Mock, call, patch
 
@@ -683,6 +685,36 @@ class TestBackupAllServicesEdgeCases:
                     assert len(results) == 20
                     assert all(success for success in results.values())
 
+    def test_services_share_run_timestamp(self, backup_engine):
+        """Test all backups in a run see one timestamp, cleared afterwards."""
+        services = [
+            ServiceConfig(
+                name=f"service{i}",
+                type="docker",
+                container_name=f"container{i}",
+                backup=True,
+            )
+            for i in range(3)
+        ]
+        seen_timestamps = []
+
+        def backup_side_effect(service_name):
+            seen_timestamps.append(backup_engine._run_timestamp)
+            return True
+
+        with patch.object(
+            backup_engine.config, "get_all_services", return_value=services
+        ):
+            with patch.object(
+                backup_engine, "backup_service", side_effect=backup_side_effect
+            ):
+                with patch.object(backup_engine, "_send_backup_summary"):
+                    backup_engine.backup_all_services()
+
+        assert len(set(seen_timestamps)) == 1
+        assert seen_timestamps[0] is not None
+        assert backup_engine._run_timestamp is None
+
 
 # Logging
 class TestBackupAllServicesLogging:
@@ -760,6 +792,188 @@ class TestBackupAllServicesLogging:
                     assert results["service1"] is False
 
 
+# Concurrency
+class TestBackupAllServicesConcurrency:
+    """Test concurrent backups when max_parallel > 1."""
+
+    def test_services_run_concurrently_when_max_parallel_set(self, backup_engine):
+        """Test backups overlap when max_parallel allows it."""
+        services = [
+            ServiceConfig(
+                name=f"service{i}",
+                type="docker",
+                container_name=f"service{i}",
+                backup=True,
+            )
+            for i in range(3)
+        ]
+
+        # Every backup waits until all three are running at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def backup_side_effect(service_name):
+            barrier.wait()
+            return True
+
+        with patch.object(
+            backup_engine.config, "get_all_services", return_value=services
+        ):
+            with patch.object(backup_engine, "_get_max_parallel", return_value=3):
+                with patch.object(
+                    backup_engine, "backup_service", side_effect=backup_side_effect
+                ):
+                    with patch.object(backup_engine, "_send_backup_summary"):
+                        results = backup_engine.backup_all_services()
+
+        assert results == {"service0": True, "service1": True, "service2": True}
+
+    def test_concurrent_results_keep_configuration_order(self, backup_engine):
+        """Test results dict follows configuration order, not completion order."""
+        services = [
+            ServiceConfig(
+                name=f"service{i}",
+                type="docker",
+                container_name=f"service{i}",
+                backup=True,
+            )
+            for i in range(4)
+        ]
+
+        def backup_side_effect(service_name):
+            if service_name == "service1":
+                raise RuntimeError("Unexpected error")
+            return service_name != "service3"
+
+        with patch.object(
+            backup_engine.config, "get_all_services", return_value=services
+        ):
+            with patch.object(backup_engine, "_get_max_parallel", return_value=2):
+                with patch.object(
+                    backup_engine, "backup_service", side_effect=backup_side_effect
+                ):
+                    with patch.object(
+                        backup_engine, "_send_backup_summary"
+                    ) as mock_summary:
+                        results = backup_engine.backup_all_services()
+
+        # One summary for the whole run, not one per service
+        mock_summary.assert_called_once()
+        assert mock_summary.call_args[0][0] == results
+        assert list(results) == ["service0", "service1", "service2", "service3"]
+        assert results == {
+            "service0": True,
+            "service1": False,
+            "service2": True,
+            "service3": False,
+        }
+
+    def test_max_parallel_read_from_config(self, backup_engine):
+        """Test max_parallel comes from global.backup.max_parallel."""
+        assert backup_engine._get_max_parallel() == 1
+
+        with patch.object(backup_engine.config, "get", return_value=4):
+            assert backup_engine._get_max_parallel() == 4
+
+    def test_concurrent_run_works_inside_event_loop(self, backup_engine):
+        """Test concurrent backups can be started from async code."""
+        services = [
+            ServiceConfig(
+                name=f"service{i}",
+                type="docker",
+                container_name=f"service{i}",
+                backup=True,
+            )
+            for i in range(2)
+        ]
+
+        async def run_from_loop():
+            return backup_engine.backup_all_services()
+
+        with patch.object(
+            backup_engine.config, "get_all_services", return_value=services
+        ):
+            with patch.object(backup_engine, "_get_max_parallel", return_value=2):
+                with patch.object(backup_engine, "backup_service", return_value=True):
+                    with patch.object(backup_engine, "_send_backup_summary"):
+                        results = asyncio.run(run_from_loop())
+
+        assert results == {"service0": True, "service1": True}
+
+
+class TestBackupAllServicesPrefetch:
+    """Test background preparation of the next service in sequential runs."""
+
+    def test_next_service_prefetched_during_backup(self, backup_engine):
+        """Test each service after the first is prefetched before its backup."""
+        services = [
+            ServiceConfig(
+                name=f"service{i}",
+                type="docker",
+                container_name=f"service{i}",
+                backup=True,
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(
+            backup_engine.config, "get_all_services", return_value=services
+        ):
+            with patch.object(backup_engine, "backup_service", return_value=True):
+                with patch.object(backup_engine, "_prefetch_service") as mock_prefetch:
+                    with patch.object(backup_engine, "_send_backup_summary"):
+                        results = backup_engine.backup_all_services()
+
+        assert results == {"service0": True, "service1": True, "service2": True}
+        assert mock_prefetch.call_args_list == [call("service1"), call("service2")]
+
+    def test_dry_run_skips_prefetch(self, backup_engine_dry_run):
+        """Test dry-run mode does not prefetch plugins or probe PBS."""
+        services = [
+            ServiceConfig(
+                name=f"service{i}",
+                type="docker",
+                container_name=f"service{i}",
+                backup=True,
+            )
+            for i in range(2)
+        ]
+
+        with patch.object(
+            backup_engine_dry_run.config, "get_all_services", return_value=services
+        ):
+            with patch.object(
+                backup_engine_dry_run, "backup_service", return_value=True
+            ):
+                with patch.object(
+                    backup_engine_dry_run, "_prefetch_service"
+                ) as mock_prefetch:
+                    with patch.object(backup_engine_dry_run, "_send_backup_summary"):
+                        backup_engine_dry_run.backup_all_services()
+
+        mock_prefetch.assert_not_called()
+
+    def test_prefetch_warms_plugin_cache(self, backup_engine):
+        """Test _prefetch_service() resolves and caches the service's plugin."""
+        backup_engine._prefetch_service("plex")
+
+        assert "lxc" in backup_engine._plugin_cache
+
+    def test_prefetch_errors_are_swallowed(self, backup_engine):
+        """Test prefetch failures never propagate to the backup run."""
+        with patch.object(
+            backup_engine,
+            "_get_plugin_for_service",
+            side_effect=RuntimeError("plugin boom"),
+        ):
+            backup_engine._prefetch_service("plex")
+
+    def test_prefetch_unknown_service_is_noop(self, backup_engine):
+        """Test prefetching a service missing from config does nothing."""
+        backup_engine._prefetch_service("does-not-exist")
+
+        assert backup_engine._plugin_cache == {}
+
+
 # Return Value
 class TestBackupAllServicesReturnValue:
     """Test return value correctness."""
@@ -15,7 +15,12 @@ from pathlib import Path
 import pytest
 
 from core.backup_engine import BackupEngine
-from core.config_loader import ConfigLoader
+from core.config_loader import (
+    BackupConfig,
+    ConfigLoader,
+    DirectStorageConfig,
+    ProxmoxBackupServerConfig,
+)
 from lib.state_manager import StateManager
 
 
@@ -214,6 +219,23 @@ services:
         assert "root" in backup_config
         assert "retention_days" in backup_config
 
+    def test_keys_match_backup_config_model(
+        self, valid_config_hybrid_path, state_manager
+    ):
+        """Test that dict keys mirror the BackupConfig model fields."""
+        config = ConfigLoader(valid_config_hybrid_path)
+        engine = BackupEngine(config, state_manager)
+
+        backup_config = engine._get_backup_config()
+
+        assert set(backup_config) == set(BackupConfig.model_fields)
+        assert set(backup_config["proxmox_backup_server"]) == set(
+            ProxmoxBackupServerConfig.model_fields
+        )
+        assert set(backup_config["direct_storage"]) == set(
+            DirectStorageConfig.model_fields
+        )
+
     def test_dry_run_doesnt_affect_config(self, valid_config_path, state_manager):
         """Test that dry_run mode doesn't affect config loading."""
         config = ConfigLoader(valid_config_path)
@@ -182,6 +182,20 @@ class TestClearPluginCacheIntegration:
         # But both should be same type
         assert type(plugin1) == type(plugin2)
 
+    def test_cache_clear_drops_shared_plugin_instances(
+        self, backup_engine, vm_service, lxc_service
+    ):
+        """Test clearing cache also drops instances shared across service types."""
+        vm_plugin = backup_engine._get_plugin_for_service(vm_service)
+
+        backup_engine._clear_plugin_cache()
+
+        # LXC shares ProxmoxPlugin with VM, but must not reuse the cleared one
+        lxc_plugin = backup_engine._get_plugin_for_service(lxc_service)
+
+        assert lxc_plugin is not vm_plugin
+        assert backup_engine._plugin_instances == {type(lxc_plugin): lxc_plugin}
+
     def test_multiple_different_services_cached_clear_removes_all(
         self, backup_engine, vm_service, docker_service, lxc_service
     ):
@@ -303,11 +317,10 @@ class TestClearPluginCacheMultipleServiceTypes:
         vm_plugin = backup_engine._get_plugin_for_service(vm_service)
         lxc_plugin = backup_engine._get_plugin_for_service(lxc_service)
 
-        # They should be different instances (each service type gets its own)
-        assert vm_plugin is not lxc_plugin
-        assert id(vm_plugin) != id(lxc_plugin)
+        # They share one ProxmoxPlugin instance
+        assert vm_plugin is lxc_plugin
 
-        # Cache should have 2 entries (keyed by "vm" and "lxc")
+        # Cache should still have 2 entries (keyed by "vm" and "lxc")
         assert len(backup_engine._plugin_cache) == 2
         assert "vm" in backup_engine._plugin_cache
         assert "lxc" in backup_engine._plugin_cache
@@ -335,11 +348,10 @@ class TestClearPluginCacheMultipleServiceTypes:
         docker_plugin = backup_engine._get_plugin_for_service(docker_service)
         systemd_plugin = backup_engine._get_plugin_for_service(systemd_service)
 
-        # They should be different instances (each service type gets its own)
-        assert docker_plugin is not systemd_plugin
-        assert id(docker_plugin) != id(systemd_plugin)
+        # They share one GenericServicePlugin instance
+        assert docker_plugin is systemd_plugin
 
-        # Cache should have 2 entries (keyed by "docker" and "systemd")
+        # Cache should still have 2 entries (keyed by "docker" and "systemd")
         assert len(backup_engine._plugin_cache) == 2
         assert "docker" in backup_engine._plugin_cache
         assert "systemd" in backup_engine._plugin_cache
@@ -351,12 +363,11 @@ class TestClearPluginCacheMultipleServiceTypes:
         self, backup_engine, vm_service, lxc_service
     ):
         """Test clearing cache affects all service types."""
-        # Get plugins (vm and lxc get separate instances)
+        # Get plugins (vm and lxc share one instance)
         vm_plugin1 = backup_engine._get_plugin_for_service(vm_service)
         lxc_plugin1 = backup_engine._get_plugin_for_service(lxc_service)
 
-        # Verify they are different instances
-        assert vm_plugin1 is not lxc_plugin1
+        assert vm_plugin1 is lxc_plugin1
 
         # Clear cache
         backup_engine._clear_plugin_cache()
@@ -369,8 +380,8 @@ class TestClearPluginCacheMultipleServiceTypes:
         assert vm_plugin1 is not vm_plugin2
         assert lxc_plugin1 is not lxc_plugin2
 
-        # And the new instances are also different from each other
-        assert vm_plugin2 is not lxc_plugin2
+        # And the new instance is again shared between them
+        assert vm_plugin2 is lxc_plugin2
 
 
 class TestClearPluginCacheConcurrency:
@@ -8,8 +8,10 @@ Tests cover:
   - Invalid input (empty string, None)
   - StateManager failure
   - Multiple services (no crosstalk)
+  - Negative caching of never-backed-up services
 """
 
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -269,6 +271,37 @@ class TestGetLastBackupTime:
             # Verify exception chaining
             assert exc_info.value.__cause__ is original_exception
 
+    def test_missing_service_negative_cached(self, backup_engine):
+        """Test that a 'never backed up' answer is reused within the TTL."""
+        with patch.object(backup_engine.state, "get", return_value=None) as mock_get:
+            assert backup_engine.get_last_backup_time("missing") is None
+            assert backup_engine.get_last_backup_time("missing") is None
+
+        mock_get.assert_called_once_with("last_backup.missing")
+
+    def test_negative_cache_expires_after_ttl(self, backup_engine):
+        """Test that the state is queried again once the TTL has passed."""
+        backup_engine.get_last_backup_time("late")
+        backup_engine.state.set("last_backup.late", "2025-01-24T12:00:00")
+
+        with patch(
+            "core.backup_engine.time.monotonic",
+            return_value=time.monotonic()
+            + BackupEngine.LAST_BACKUP_NEGATIVE_TTL_SECONDS
+            + 1,
+        ):
+            result = backup_engine.get_last_backup_time("late")
+
+        assert result == "2025-01-24T12:00:00"
+
+    def test_update_backup_state_invalidates_negative_cache(self, backup_engine):
+        """Test that recording a backup makes it visible immediately."""
+        assert backup_engine.get_last_backup_time("fresh") is None
+
+        backup_engine._update_backup_state("fresh", success=True)
+
+        assert backup_engine.get_last_backup_time("fresh") is not None
+
 
 class TestGetBackupStatus:
     """Test get_backup_status() method."""
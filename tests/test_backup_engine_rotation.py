@@ -169,18 +169,18 @@ class TestRotateOldBackupsFailure:
         old_files = create_old_backup_files(backup_dir, 3, days_old=35)
 
         # Create a side effect function that raises PermissionError for middle file
-        original_unlink = Path.unlink
+        original_unlink = os.unlink
 
-        def unlink_with_error(self, *args, **kwargs):
-            if self == old_files[1]:
+        def unlink_with_error(path, *args, **kwargs):
+            if Path(path) == old_files[1]:
                 raise PermissionError("Permission denied")
-            return original_unlink(self, *args, **kwargs)
+            return original_unlink(path, *args, **kwargs)
 
         # Mock
         with patch.object(
             backup_engine, "_apply_retention_policy", return_value=old_files
         ):
-            with patch.object(Path, "unlink", unlink_with_error):
+            with patch("core.backup_engine.os.unlink", unlink_with_error):
                 # Execute
                 deleted_count = backup_engine._rotate_old_backups(service_name)
 
@@ -203,8 +203,9 @@ class TestRotateOldBackupsFailure:
         with patch.object(
             backup_engine, "_apply_retention_policy", return_value=old_files
         ):
-            with patch.object(
-                Path, "unlink", side_effect=PermissionError("Permission denied")
+            with patch(
+                "core.backup_engine.os.unlink",
+                side_effect=PermissionError("Permission denied"),
             ):
                 # Execute
                 deleted_count = backup_engine._rotate_old_backups(service_name)
@@ -417,18 +418,18 @@ class TestRotateOldBackupsLogging:
         old_files = create_old_backup_files(backup_dir, 2, days_old=35)
 
         # Create a side effect function that raises PermissionError for first file
-        original_unlink = Path.unlink
+        original_unlink = os.unlink
 
-        def unlink_with_error(self, *args, **kwargs):
-            if self == old_files[0]:
+        def unlink_with_error(path, *args, **kwargs):
+            if Path(path) == old_files[0]:
                 raise PermissionError("Permission denied")
-            return original_unlink(self, *args, **kwargs)
+            return original_unlink(path, *args, **kwargs)
 
         # Mock
         with patch.object(
             backup_engine, "_apply_retention_policy", return_value=old_files
         ):
-            with patch.object(Path, "unlink", unlink_with_error):
+            with patch("core.backup_engine.os.unlink", unlink_with_error):
                 # Execute
                 deleted_count = backup_engine._rotate_old_backups(service_name)
 
@@ -472,8 +473,9 @@ class TestRotateOldBackupsReturnValue:
         with patch.object(
             backup_engine, "_apply_retention_policy", return_value=old_files
         ):
-            with patch.object(
-                Path, "unlink", side_effect=PermissionError("Permission denied")
+            with patch(
+                "core.backup_engine.os.unlink",
+                side_effect=PermissionError("Permission denied"),
             ):
                 # Execute
                 deleted_count = backup_engine._rotate_old_backups(service_name)
@@ -242,7 +242,7 @@ class TestUpdateBackupStateErrorHandling:
         # Mock state manager to fail
         with patch.object(
             backup_engine.state,
-            "set",
+            "set_many",
             side_effect=Exception("Database connection lost"),
         ):
             with pytest.raises(StateError) as exc_info:
@@ -258,7 +258,9 @@ class TestUpdateBackupStateErrorHandling:
         """Test that exception chaining is preserved for debugging."""
         original_exception = RuntimeError("Original error")
 
-        with patch.object(backup_engine.state, "set", side_effect=original_exception):
+        with patch.object(
+            backup_engine.state, "set_many", side_effect=original_exception
+        ):
             with pytest.raises(StateError) as exc_info:
                 backup_engine._update_backup_state(service_name="test", success=True)
 
@@ -405,18 +407,15 @@ class TestUpdateBackupStateStateKeys:
             duration=10.5,
         )
 
-        # Verify state.set was called with correct keys
-        calls = [call[0] for call in mock_state.set.call_args_list]
-        expected_keys = [
-            ("last_backup.my-service",),
-            ("backup_status.my-service",),
-            ("backup_path.my-service",),
-            ("backup_duration.my-service",),
-            ("backup_error.my-service",),
-        ]
-
-        # Check that all expected keys were used
-        for expected_key in expected_keys:
-            assert any(
-                call[0] == expected_key[0] for call in calls
-            ), f"Expected key {expected_key[0]} not found in calls"
+        # Verify all keys were written in a single set_many call
+        mock_state.set_many.assert_called_once()
+        written_keys = set(mock_state.set_many.call_args[0][0])
+        expected_keys = {
+            "last_backup.my-service",
+            "backup_status.my-service",
+            "backup_path.my-service",
+            "backup_duration.my-service",
+            "backup_error.my-service",
+        }
+
+        assert written_keys == expected_keys
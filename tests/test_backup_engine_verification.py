@@ -6,12 +6,15 @@ Tests cover:
 - Failure cases (missing, empty, corrupted files)
 - Input validation
 - Edge cases
+- Public verify_backup() / verify_backups() wrappers
 """
 
 import gzip
 import os
 import tarfile
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -75,6 +78,39 @@ class TestVerifyBackupIntegritySuccess:
         assert success is True
         assert error is None
 
+    def test_file_statted_once(self, backup_engine, tmp_path, monkeypatch):
+        """Test existence, type and size come from a single os.stat() call."""
+        backup_file = tmp_path / "backup.bin"
+        backup_file.write_bytes(b"x" * 2048)
+
+        stat_calls = []
+        real_stat = os.stat
+
+        def counting_stat(path, *args, **kwargs):
+            stat_calls.append(path)
+            return real_stat(path, *args, **kwargs)
+
+        monkeypatch.setattr("core.backup_engine.os.stat", counting_stat)
+
+        success, error = backup_engine._verify_backup_integrity(
+            str(backup_file), "test-service"
+        )
+
+        assert success is True
+        assert stat_calls == [str(backup_file)]
+
+    def test_path_through_file_returns_false(self, backup_engine, tmp_path):
+        """Test a path with a regular file as a parent reports missing file."""
+        parent_file = tmp_path / "not_a_dir"
+        parent_file.write_bytes(b"x")
+
+        success, error = backup_engine._verify_backup_integrity(
+            str(parent_file / "backup.tar.gz"), "test-service"
+        )
+
+        assert success is False
+        assert "does not exist" in error.lower()
+
     def test_large_file_above_minimum_size_passes(self, backup_engine, tmp_path):
         """Test large file above minimum size passes."""
         # Create a large backup file (non-archive)
@@ -497,6 +533,66 @@ class TestVerifyBackupIntegrityArchiveTypes:
         assert error is not None
         assert "corrupted" in error.lower() or "gzip" in error.lower()
 
+    def test_tar_members_not_walked_by_default(
+        self, backup_engine, tmp_path, monkeypatch
+    ):
+        """Test shallow verification probes the header without getmembers()."""
+        backup_file = tmp_path / "backup.tar"
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("test content" * 100)
+
+        with tarfile.open(backup_file, "w:") as tar:
+            tar.add(test_file, arcname="test.txt")
+
+        def fail_getmembers(*args, **kwargs):
+            raise AssertionError("getmembers called during shallow verification")
+
+        monkeypatch.setattr(tarfile.TarFile, "getmembers", fail_getmembers)
+
+        success, error = backup_engine._verify_backup_integrity(
+            str(backup_file), "test-service"
+        )
+
+        assert success is True
+        assert error is None
+
+    def test_deep_verification_detects_bad_gzip_crc(self, backup_engine, tmp_path):
+        """Test deep=True decompresses to EOF and catches a bad CRC."""
+        backup_file = tmp_path / "backup.gz"
+        with gzip.open(backup_file, "wb") as gz:
+            gz.write(os.urandom(4096))
+
+        # Flip the stored CRC32 in the 8-byte gzip trailer
+        data = bytearray(backup_file.read_bytes())
+        data[-8] ^= 0xFF
+        backup_file.write_bytes(bytes(data))
+
+        shallow = backup_engine._verify_backup_integrity(
+            str(backup_file), "test-service"
+        )
+        deep = backup_engine._verify_backup_integrity(
+            str(backup_file), "test-service", deep=True
+        )
+
+        assert shallow == (True, None)
+        assert deep[0] is False
+        assert "corrupted gzip" in deep[1].lower()
+
+    def test_deep_verification_detects_truncated_gzip(self, backup_engine, tmp_path):
+        """Test deep=True reports a truncated gzip file as corrupted."""
+        backup_file = tmp_path / "backup.gz"
+        with gzip.open(backup_file, "wb") as gz:
+            gz.write(os.urandom(4096))
+
+        backup_file.write_bytes(backup_file.read_bytes()[:-16])
+
+        success, error = backup_engine._verify_backup_integrity(
+            str(backup_file), "test-service", deep=True
+        )
+
+        assert success is False
+        assert "corrupted gzip" in error.lower()
+
     def test_uppercase_extensions_handled(self, backup_engine, tmp_path):
         """Test uppercase extensions are handled (case-insensitive)."""
         # Create file with uppercase extension
@@ -543,3 +639,124 @@ class TestVerifyBackupIntegrityLogging:
         )
 
         assert success is False
+
+
+class TestVerifyBackups:
+    """Test the public verify_backup() and verify_backups() methods."""
+
+    def test_verify_backup_returns_bool(self, backup_engine, tmp_path):
+        """Test verify_backup() returns the integrity check's success flag."""
+        service_dir = tmp_path / "nextcloud"
+        service_dir.mkdir()
+        good = service_dir / "good.dat"
+        good.write_bytes(b"x" * 2048)
+
+        assert backup_engine.verify_backup(good) is True
+        assert backup_engine.verify_backup(service_dir / "missing.dat") is False
+
+    def test_verify_backup_uses_directory_as_service_name(
+        self, backup_engine, tmp_path
+    ):
+        """Test the service directory name is passed for logging context."""
+        backup_file = tmp_path / "nextcloud" / "backup.dat"
+
+        with patch.object(
+            backup_engine, "_verify_backup_integrity", return_value=(True, None)
+        ) as mock_verify:
+            assert backup_engine.verify_backup(backup_file) is True
+
+        mock_verify.assert_called_once_with(str(backup_file), "nextcloud", deep=False)
+
+    def test_verify_backups_passes_deep_through(self, backup_engine, tmp_path):
+        """Test deep=True reaches every check and catches a bad gzip CRC."""
+        service_dir = tmp_path / "nextcloud"
+        service_dir.mkdir()
+        backup_file = service_dir / "backup.gz"
+        with gzip.open(backup_file, "wb") as gz:
+            gz.write(os.urandom(4096))
+
+        # Flip the stored CRC32 in the 8-byte gzip trailer
+        data = bytearray(backup_file.read_bytes())
+        data[-8] ^= 0xFF
+        backup_file.write_bytes(bytes(data))
+
+        assert backup_engine.verify_backup(backup_file) is True
+        assert backup_engine.verify_backup(backup_file, deep=True) is False
+        assert backup_engine.verify_backups([backup_file]) == {backup_file: True}
+        assert backup_engine.verify_backups([backup_file], deep=True) == {
+            backup_file: False
+        }
+
+    def test_deep_verification_detects_truncated_tar_gz(self, backup_engine, tmp_path):
+        """Test deep=True reports a truncated tar.gz instead of raising."""
+        service_dir = tmp_path / "nextcloud"
+        service_dir.mkdir()
+        payload = tmp_path / "payload.bin"
+        payload.write_bytes(os.urandom(64 * 1024))
+        backup_file = service_dir / "backup.tar.gz"
+        with tarfile.open(backup_file, "w:gz") as tar:
+            tar.add(payload, arcname="payload.bin")
+
+        data = backup_file.read_bytes()
+        backup_file.write_bytes(data[: len(data) // 2])
+
+        assert backup_engine.verify_backup(backup_file) is True
+        assert backup_engine.verify_backup(backup_file, deep=True) is False
+
+        success, error = backup_engine._verify_backup_integrity(
+            str(backup_file), "nextcloud", deep=True
+        )
+        assert success is False
+        assert "corrupted tar.gz" in error.lower()
+
+    def test_verify_backups_maps_results_in_input_order(self, backup_engine, tmp_path):
+        """Test every path is verified and results keep input order."""
+        paths = []
+        for index in range(5):
+            backup_file = tmp_path / f"backup_{index}.dat"
+            if index % 2 == 0:
+                backup_file.write_bytes(b"x" * 2048)
+            paths.append(backup_file)
+
+        results = backup_engine.verify_backups(paths, max_parallel=3)
+
+        assert list(results) == paths
+        assert list(results.values()) == [True, False, True, False, True]
+
+    def test_verify_backups_runs_checks_concurrently(self, backup_engine, tmp_path):
+        """Test checks overlap instead of running one after another."""
+        paths = [tmp_path / f"backup_{index}.dat" for index in range(4)]
+        barrier = threading.Barrier(len(paths), timeout=5)
+
+        def wait_for_all(backup_path, deep=False):
+            barrier.wait()
+            return True
+
+        with patch.object(backup_engine, "verify_backup", side_effect=wait_for_all):
+            results = backup_engine.verify_backups(paths)
+
+        assert all(results.values())
+
+    def test_verify_backups_empty_list(self, backup_engine):
+        """Test an empty path list returns an empty dict."""
+        assert backup_engine.verify_backups([]) == {}
+
+    def test_verify_backups_error_in_one_file_keeps_other_results(
+        self, backup_engine, tmp_path
+    ):
+        """Test an exception verifying one file only marks that file False."""
+        good = tmp_path / "good.dat"
+        good.write_bytes(b"x" * 2048)
+        broken = tmp_path / "broken.tar.gz"
+
+        original = backup_engine.verify_backup
+
+        def verify(backup_path, deep=False):
+            if backup_path == broken:
+                raise EOFError("Compressed file ended before the end-of-stream")
+            return original(backup_path, deep=deep)
+
+        with patch.object(backup_engine, "verify_backup", side_effect=verify):
+            results = backup_engine.verify_backups([good, broken], deep=True)
+
+        assert results == {good: True, broken: False}
@@ -10,8 +10,10 @@ Tests cover:
 """
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 from pydantic import ValidationError
 
 from core.config_loader import (
@@ -23,6 +25,8 @@ from core.config_loader import (
     HypervisorConfig,
     ProxmoxBackupServerConfig,
     ServiceConfig,
+    _compile_key,
+    _parse_yaml_file,
 )
 
 
@@ -125,6 +129,90 @@ class TestValidation:
         errors = exc_info.value.__cause__.errors()
         assert len(errors) > 0
 
+    def test_validation_error_message_lists_each_error(self, tmp_path):
+        """Test the ConfigError message counts and locates every error."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
+global:
+  hypervisor:
+    type: invalid_hypervisor
+    host: localhost
+    username: admin
+  backup:
+    root: /tmp/backups
+    retention_days: 0
+  notification:
+    type: email
+    settings: {}
+"""
+        )
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader(config_file)
+
+        message = str(exc_info.value)
+        assert message.startswith("Configuration validation failed with 2 error(s):\n")
+        assert "  - global.hypervisor.type: " in message
+        assert "  - global.backup.retention_days: " in message
+        assert message.endswith("\n")
+
+    def test_enum_fields_case_insensitive(self, tmp_path):
+        """Test enum-like type/format fields accept any case and are lowered."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
+global:
+  hypervisor:
+    type: Proxmox
+    host: localhost
+    username: admin
+  backup:
+    root: /tmp/backups
+    direct_storage:
+      path: /mnt/dumps
+      format: TAR
+  notification:
+    type: EMAIL
+    settings: {}
+
+services:
+  - name: web
+    type: LXC
+    vmid: 100
+    node: pve
+"""
+        )
+
+        loader = ConfigLoader(config_file)
+
+        assert loader.get("global.hypervisor.type") == "proxmox"
+        assert loader.get("global.backup.direct_storage.format") == "tar"
+        assert loader.get("global.notification.type") == "email"
+        assert loader.get_service_config("web").type == "lxc"
+
+    def test_non_string_type_is_validation_error(self, tmp_path):
+        """Test a non-string type value fails validation instead of crashing."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
+global:
+  hypervisor:
+    type: 42
+    host: localhost
+    username: admin
+  backup:
+    root: /tmp/backups
+  notification:
+    type: email
+    settings: {}
+"""
+        )
+        with pytest.raises(ConfigError) as exc_info:
+            ConfigLoader(config_file)
+
+        errors = exc_info.value.__cause__.errors()
+        assert any("hypervisor" in str(e["loc"]) for e in errors)
+
     def test_invalid_hypervisor_type(self, tmp_path):
         """Test validation of invalid hypervisor type."""
         config_file = tmp_path / "config.yaml"
@@ -274,6 +362,32 @@ class TestDotNotation:
         assert isinstance(settings, dict)
         assert "smtp_host" in settings
 
+    def test_get_value_inside_dict(self, valid_loader):
+        """Test keys continue into plain dicts below the models."""
+        settings = valid_loader.get("global.notification.settings")
+        assert (
+            valid_loader.get("global.notification.settings.smtp_host")
+            == settings["smtp_host"]
+        )
+        # Dict methods are not config keys
+        assert valid_loader.get("global.notification.settings.items") is None
+
+    def test_attributes_of_leaf_values_not_exposed(self, valid_loader):
+        """Test keys cannot reach attributes of non-model values like Path."""
+        assert valid_loader.get("global.backup.root.name", "missing") == "missing"
+
+    def test_key_resolution_shared_across_loaders(self, valid_config_path):
+        """Test a dotted key is split once and reused by every loader."""
+        _compile_key.cache_clear()
+
+        first = ConfigLoader(valid_config_path)
+        second = ConfigLoader(valid_config_path)
+        assert first.get("global.hypervisor.type") == "proxmox"
+        assert second.get("global.hypervisor.type") == "proxmox"
+
+        info = _compile_key.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
 
 # Test: Array Access
 class TestArrayAccess:
@@ -325,6 +439,45 @@ class TestServiceAccess:
         assert "plex" in names
         assert "nginx" in names
 
+    def test_get_service_config_uses_name_index(self, valid_loader):
+        """Test service lookup does not walk the config through get()."""
+        with patch.object(valid_loader, "get", side_effect=AssertionError):
+            assert valid_loader.get_service_config("nginx").name == "nginx"
+            assert valid_loader.get_service_config("nonexistent") is None
+
+    def test_duplicate_service_name_returns_first(self, tmp_path):
+        """Test the first service defined with a name is returned."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            """
+global:
+  hypervisor:
+    type: proxmox
+    host: localhost
+    username: admin
+  backup:
+    root: /tmp/backups
+  notification:
+    type: email
+    settings: {}
+
+services:
+  - name: web
+    type: lxc
+    vmid: 100
+    node: pve
+  - name: web
+    type: lxc
+    vmid: 200
+    node: pve
+"""
+        )
+
+        loader = ConfigLoader(config_file)
+
+        assert loader.get_service_config("web").vmid == 100
+        assert len(loader.get_all_services()) == 2
+
     def test_service_extra_fields_allowed(self, valid_loader):
         """Test that services can have extra fields."""
         plex = valid_loader.get_service_config("plex")
@@ -400,6 +553,62 @@ global:
         # use_tls should be added
         assert settings["use_tls"] is True
 
+    def test_merge_does_not_leak_into_yaml_anchors(self, tmp_path):
+        """Test overriding an aliased mapping leaves the anchor untouched."""
+        base_config = tmp_path / "base.yaml"
+        base_config.write_text(
+            """
+global:
+  hypervisor:
+    type: proxmox
+    host: localhost
+    username: admin
+  backup:
+    root: /tmp/backups
+  notification:
+    type: email
+    settings: &smtp
+      smtp_host: localhost
+      smtp_port: 587
+
+services:
+  - name: mail
+    type: lxc
+    vmid: 100
+    node: pve
+    smtp: *smtp
+"""
+        )
+
+        override_config = tmp_path / "override.yaml"
+        override_config.write_text(
+            """
+global:
+  notification:
+    settings:
+      smtp_port: 465
+"""
+        )
+
+        loader = ConfigLoader(base_config, merge_configs=[override_config])
+
+        assert loader.get("global.notification.settings")["smtp_port"] == 465
+        assert loader.get_raw_config()["services"][0]["smtp"]["smtp_port"] == 587
+
+    def test_merge_deeply_nested_dicts(self, valid_loader):
+        """Test nesting deeper than the recursion limit merges correctly."""
+        depth = 2000
+        base = override = None
+        for _ in range(depth):
+            base = {"level": base or {"kept": True}}
+            override = {"level": override or {"added": True}}
+
+        merged = valid_loader._merge_configs(base, override)
+
+        for _ in range(depth):
+            merged = merged["level"]
+        assert merged == {"kept": True, "added": True}
+
 
 # Test: YAML Parsing Errors
 class TestYAMLErrors:
@@ -448,6 +657,88 @@ global:
             ConfigLoader(config_file)
         assert "dictionary" in str(exc_info.value).lower()
 
+    def test_uses_libyaml_loader_when_available(self, valid_config_path):
+        """Test YAML is parsed with the C loader when PyYAML has libyaml."""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        _parse_yaml_file.cache_clear()
+
+        with patch("core.config_loader.yaml.load", wraps=yaml.load) as mock_load:
+            ConfigLoader(valid_config_path)
+
+        assert mock_load.call_args.kwargs["Loader"] is expected
+
+    def test_unchanged_file_parsed_once(self, valid_config_path):
+        """Test repeat loads of an unchanged file reuse the parsed YAML."""
+        _parse_yaml_file.cache_clear()
+
+        with patch("core.config_loader.yaml.load", wraps=yaml.load) as mock_load:
+            first = ConfigLoader(valid_config_path)
+            second = ConfigLoader(valid_config_path)
+
+        assert mock_load.call_count == 1
+        assert first.get_raw_config() == second.get_raw_config()
+
+    def test_modified_file_parsed_again(self, tmp_path):
+        """Test editing a file invalidates its cached parse."""
+        config_file = tmp_path / "config.yaml"
+        template = """
+global:
+  hypervisor:
+    type: proxmox
+    host: {host}
+    username: admin
+  backup:
+    root: /tmp/backups
+  notification:
+    type: email
+    settings: {{}}
+"""
+        config_file.write_text(template.format(host="first.local"))
+        assert ConfigLoader(config_file).get("global.hypervisor.host") == "first.local"
+
+        # Different length, so the size changes even if mtime does not
+        config_file.write_text(template.format(host="second.example"))
+
+        assert (
+            ConfigLoader(config_file).get("global.hypervisor.host") == "second.example"
+        )
+
+    def test_cached_yaml_not_shared_between_loaders(self, valid_config_path):
+        """Test mutating one loader's raw config does not leak into the next."""
+        first = ConfigLoader(valid_config_path)
+        first._raw_config["global"]["hypervisor"]["host"] = "mutated"
+
+        second = ConfigLoader(valid_config_path)
+
+        assert second.get_raw_config()["global"]["hypervisor"]["host"] != "mutated"
+
+    def test_invalid_utf8_raises_value_error(self, tmp_path):
+        """Test undecodable bytes are reported as a YAML parse error."""
+        config_file = tmp_path / "latin1.yaml"
+        config_file.write_bytes("global:\n  name: caf\u00e9\n".encode("latin-1"))
+
+        with pytest.raises(ValueError) as exc_info:
+            ConfigLoader(config_file)
+        assert "parse" in str(exc_info.value).lower()
+
+    def test_utf8_bom_accepted(self, tmp_path, valid_config_path):
+        """Test a UTF-8 byte order mark does not break parsing."""
+        config_file = tmp_path / "bom.yaml"
+        config_file.write_bytes(b"\xef\xbb\xbf" + valid_config_path.read_bytes())
+
+        loader = ConfigLoader(config_file)
+
+        assert loader.get("global.hypervisor.type") == "proxmox"
+
+    def test_python_object_tags_rejected(self, tmp_path):
+        """Test the loader stays safe and refuses arbitrary Python objects."""
+        config_file = tmp_path / "unsafe.yaml"
+        config_file.write_text("global: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(ValueError) as exc_info:
+            ConfigLoader(config_file)
+        assert "parse" in str(exc_info.value).lower()
+
 
 # Test: Edge Cases
 class TestEdgeCases:
@@ -522,6 +813,23 @@ services:
 class TestPydanticModels:
     """Test Pydantic model behaviors."""
 
+    def test_global_models_are_frozen(self, valid_loader):
+        """Test validated global sections cannot be modified after load."""
+        backup = valid_loader.get("global.backup")
+
+        with pytest.raises(ValidationError):
+            backup.retention_days = 1
+
+        assert valid_loader.get("global.backup.retention_days") != 1
+
+    def test_service_models_stay_mutable(self, valid_loader):
+        """Test ServiceConfig keeps allowing attribute assignment."""
+        service = valid_loader.get_service_config("plex")
+
+        service.node = "pve2"
+
+        assert valid_loader.get_service_config("plex").node == "pve2"
+
     def test_extra_fields_forbidden_in_global(self, tmp_path):
         """Test that extra fields in global config are rejected."""
         config_file = tmp_path / "config.yaml"
@@ -672,10 +980,8 @@ services:
 
     def test_vmid_range_validation(self, tmp_path):
         """Test that vmid must be between 100 and 999999."""
-        # Test vmid too low
         config_file = tmp_path / "config.yaml"
-        config_file.write_text(
-            """
+        template = """
 global:
   hypervisor:
     type: proxmox
@@ -685,20 +991,24 @@ global:
     root: /tmp/backups
   notification:
     type: email
-    settings: {}
+    settings: {{}}
 
 services:
   - name: test_vm
     type: vm
-    vmid: 99
+    vmid: {vmid}
     node: pve
 """
-        )
-        with pytest.raises(ConfigError) as exc_info:
-            ConfigLoader(config_file)
+        # Each bound is reported by the range constraint it violates
+        for vmid, bound in ((99, "100"), (1000000, "999999")):
+            config_file.write_text(template.format(vmid=vmid))
+            with pytest.raises(ConfigError) as exc_info:
+                ConfigLoader(config_file)
 
-        errors = exc_info.value.__cause__.errors()
-        assert any("100" in str(e) and "999999" in str(e) for e in errors)
+            errors = exc_info.value.__cause__.errors()
+            assert any(
+                e["loc"][-1] == "vmid" and bound in e["msg"] for e in errors
+            ), errors
 
     def test_vmid_valid_range(self, tmp_path):
         """Test that valid vmid range works."""
@@ -1151,6 +1461,26 @@ services:
         assert loader.get("global.backup.direct_storage") is None
 
 
+class TestBackupParallelism:
+    """Test global.backup.max_parallel configuration."""
+
+    def test_max_parallel_defaults_to_sequential(self, valid_loader):
+        """Test that max_parallel defaults to 1 (sequential backups)."""
+        assert valid_loader.get("global.backup.max_parallel") == 1
+
+    def test_max_parallel_accepts_positive_value(self):
+        """Test that a positive max_parallel is accepted."""
+        config = BackupConfig(root=Path("/mnt/backups"), max_parallel=4)
+        assert config.max_parallel == 4
+
+    def test_max_parallel_rejects_zero(self):
+        """Test that max_parallel below 1 is rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            BackupConfig(root=Path("/mnt/backups"), max_parallel=0)
+
+        assert "max_parallel must be at least 1" in str(exc_info.value)
+
+
 class TestHostServiceType:
     """Test host service type for Proxmox host config backups."""
 
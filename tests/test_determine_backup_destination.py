@@ -13,6 +13,8 @@ Tests cover:
 - Edge cases
 """
 
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -132,7 +134,7 @@ class TestDetermineBackupDestinationPBS:
         with patch.object(
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
-            with patch("requests.get", return_value=mock_response) as mock_get:
+            with patch("requests.Session.get", return_value=mock_response) as mock_get:
                 result = backup_engine._determine_backup_destination(vm_service)
 
                 # Verify method is PBS
@@ -174,7 +176,7 @@ class TestDetermineBackupDestinationPBS:
         with patch.object(
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
-            with patch("requests.get", return_value=mock_response):
+            with patch("requests.Session.get", return_value=mock_response):
                 result = backup_engine._determine_backup_destination(lxc_service)
 
                 assert result["method"] == "pbs"
@@ -322,7 +324,8 @@ class TestDetermineBackupDestinationPBS:
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
             with patch(
-                "requests.get", side_effect=requests.exceptions.Timeout("Timeout")
+                "requests.Session.get",
+                side_effect=requests.exceptions.Timeout("Timeout"),
             ):
                 with pytest.raises(BackupError) as exc_info:
                     backup_engine._determine_backup_destination(vm_service)
@@ -356,7 +359,7 @@ class TestDetermineBackupDestinationPBS:
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
             with patch(
-                "requests.get",
+                "requests.Session.get",
                 side_effect=requests.exceptions.ConnectionError("Connection refused"),
             ):
                 with pytest.raises(BackupError) as exc_info:
@@ -390,7 +393,7 @@ class TestDetermineBackupDestinationPBS:
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
             with patch(
-                "requests.get",
+                "requests.Session.get",
                 side_effect=requests.exceptions.RequestException("Generic error"),
             ):
                 with pytest.raises(BackupError) as exc_info:
@@ -426,7 +429,7 @@ class TestDetermineBackupDestinationPBS:
         with patch.object(
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
-            with patch("requests.get", return_value=mock_response) as mock_get:
+            with patch("requests.Session.get", return_value=mock_response) as mock_get:
                 backup_engine._determine_backup_destination(vm_service)
 
                 # Verify custom port was used
@@ -459,7 +462,7 @@ class TestDetermineBackupDestinationPBS:
         with patch.object(
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
-            with patch("requests.get", return_value=mock_response) as mock_get:
+            with patch("requests.Session.get", return_value=mock_response) as mock_get:
                 backup_engine._determine_backup_destination(vm_service)
 
                 # Verify SSL was enabled
@@ -467,6 +470,154 @@ class TestDetermineBackupDestinationPBS:
                 assert call_args[1]["verify"] is True
 
 
+class TestDetermineBackupDestinationPBSProbeCache:
+    """Test PBS connectivity checks are reused across services."""
+
+    @pytest.fixture
+    def pbs_backup_config(self):
+        """Return backup config with PBS enabled."""
+        return {
+            "enabled": True,
+            "root": Path("/mnt/backups"),
+            "retention_days": 30,
+            "compression": True,
+            "proxmox_backup_server": {
+                "enabled": True,
+                "server": "192.168.1.100",
+                "port": 8007,
+                "datastore": "test-datastore",
+                "username": "root@pam",
+                "password": "test_password",
+                "password_command": None,
+                "verify_ssl": False,
+            },
+            "direct_storage": None,
+        }
+
+    def test_pbs_probed_once_for_multiple_services(
+        self, backup_engine, vm_service, lxc_service, pbs_backup_config
+    ):
+        """Test repeated destinations reuse a successful PBS probe."""
+        with patch.object(
+            backup_engine, "_get_backup_config", return_value=pbs_backup_config
+        ):
+            with patch("requests.Session.get", return_value=Mock()) as mock_get:
+                first = backup_engine._determine_backup_destination(vm_service)
+                second = backup_engine._determine_backup_destination(lxc_service)
+
+                assert first["method"] == "pbs"
+                assert second["method"] == "pbs"
+                mock_get.assert_called_once()
+
+    def test_pbs_probe_repeated_after_ttl_expires(
+        self, backup_engine, vm_service, pbs_backup_config
+    ):
+        """Test expired probe results trigger a fresh connectivity check."""
+        with patch.object(
+            backup_engine, "_get_backup_config", return_value=pbs_backup_config
+        ):
+            with patch("requests.Session.get", return_value=Mock()) as mock_get:
+                backup_engine._determine_backup_destination(vm_service)
+
+                # Expire the cached probe
+                backup_engine._pbs_probe_cache[("192.168.1.100", 8007)] = 0.0
+                backup_engine._determine_backup_destination(vm_service)
+
+                assert mock_get.call_count == 2
+
+    def test_failed_pbs_probe_not_cached(
+        self, backup_engine, vm_service, pbs_backup_config
+    ):
+        """Test a failed probe is retried on the next service."""
+        with patch.object(
+            backup_engine, "_get_backup_config", return_value=pbs_backup_config
+        ):
+            with patch(
+                "requests.Session.get",
+                side_effect=[requests.exceptions.ConnectionError("refused"), Mock()],
+            ) as mock_get:
+                with pytest.raises(BackupError):
+                    backup_engine._determine_backup_destination(vm_service)
+
+                result = backup_engine._determine_backup_destination(vm_service)
+
+                assert result["method"] == "pbs"
+                assert mock_get.call_count == 2
+
+    def test_pbs_fields_validated_once_per_config(
+        self, backup_engine, vm_service, pbs_backup_config
+    ):
+        """Test required-field validation is skipped for an already-checked config."""
+        with patch.object(
+            backup_engine, "_get_backup_config", return_value=pbs_backup_config
+        ):
+            with patch("requests.Session.get", return_value=Mock()):
+                backup_engine._determine_backup_destination(vm_service)
+                assert (
+                    backup_engine._validated_pbs_config
+                    is pbs_backup_config["proxmox_backup_server"]
+                )
+
+        # A different (incomplete) config object is still validated
+        incomplete = dict(pbs_backup_config)
+        incomplete["proxmox_backup_server"] = dict(
+            pbs_backup_config["proxmox_backup_server"], datastore=None
+        )
+        with patch.object(backup_engine, "_get_backup_config", return_value=incomplete):
+            with pytest.raises(BackupError, match="datastore"):
+                backup_engine._determine_backup_destination(vm_service)
+
+    def test_concurrent_services_share_one_probe(
+        self, backup_engine, vm_service, pbs_backup_config
+    ):
+        """Test services resolving concurrently trigger a single probe."""
+
+        def slow_get(*_args, **_kwargs):
+            time.sleep(0.05)
+            return Mock()
+
+        results = []
+        with patch.object(
+            backup_engine, "_get_backup_config", return_value=pbs_backup_config
+        ):
+            with patch("requests.Session.get", side_effect=slow_get) as mock_get:
+                threads = [
+                    threading.Thread(
+                        target=lambda: results.append(
+                            backup_engine._determine_backup_destination(vm_service)
+                        )
+                    )
+                    for _ in range(4)
+                ]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+
+                assert mock_get.call_count == 1
+
+        assert [r["method"] for r in results] == ["pbs"] * 4
+
+
+class TestDetermineBackupDestinationPBSSession:
+    """Test the shared PBS HTTP session."""
+
+    def test_session_created_once_and_reused(self, backup_engine):
+        """Test the PBS session is created lazily and reused."""
+        assert backup_engine._pbs_session is None
+
+        session = backup_engine._get_pbs_session()
+
+        assert session is backup_engine._get_pbs_session()
+
+    def test_session_mounts_pooled_https_adapter(self, backup_engine):
+        """Test the HTTPS adapter is sized from the class pool constants."""
+        adapter = backup_engine._get_pbs_session().get_adapter("https://pbs:8007")
+
+        assert adapter._pool_connections == BackupEngine.PBS_POOL_CONNECTIONS
+        assert adapter._pool_maxsize == BackupEngine.PBS_POOL_MAXSIZE
+
+
 class TestDetermineBackupDestinationDirectStorage:
     """Test direct storage backup destination logic."""
 
@@ -914,7 +1065,7 @@ class TestDetermineBackupDestinationPriority:
         with patch.object(
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
-            with patch("requests.get", return_value=mock_response):
+            with patch("requests.Session.get", return_value=mock_response):
                 result = backup_engine._determine_backup_destination(vm_service)
 
                 # Should use PBS, not direct storage
@@ -1037,7 +1188,7 @@ class TestDetermineBackupDestinationEdgeCases:
         with patch.object(
             backup_engine, "_get_backup_config", return_value=mock_config
         ):
-            with patch("requests.get", return_value=mock_response):
+            with patch("requests.Session.get", return_value=mock_response):
                 result = backup_engine._determine_backup_destination(vm_service)
 
                 # Check dict structure
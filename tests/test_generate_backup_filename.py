@@ -147,6 +147,8 @@ class TestGenerateBackupFilename:
         test_cases = [
             ("my service", "my_service"),  # Space to underscore
             ("service/name", "service_name"),  # Slash to underscore
+            ("service\\name", "service_name"),  # Backslash to underscore
+            ("service:name", "service_name"),  # Colon to underscore
             ("my-service", "my-service"),  # Dash preserved
             ("service.name", "service.name"),  # Dot preserved
         ]
@@ -271,3 +273,21 @@ class TestGenerateBackupFilename:
             filename = backup_engine._generate_backup_filename(input_name, "vm")
             # Check that expected chars are handled
             assert expected_prefix in filename
+
+    def test_explicit_timestamp_used(self, backup_engine):
+        """Test that a precomputed timestamp is used verbatim."""
+        filename = backup_engine._generate_backup_filename(
+            "test", "vm", timestamp="20250124_120000"
+        )
+
+        assert filename == "test_20250124_120000_vm.tar.gz"
+
+    def test_run_timestamp_shared_across_services(self, backup_engine):
+        """Test that filenames within a backup run share the run timestamp."""
+        backup_engine._run_timestamp = "20250124_120000"
+
+        filename1 = backup_engine._generate_backup_filename("nextcloud", "vm")
+        filename2 = backup_engine._generate_backup_filename("plex", "lxc")
+
+        assert filename1 == "nextcloud_20250124_120000_vm.tar.gz"
+        assert filename2 == "plex_20250124_120000_lxc.tar.gz"
@@ -15,6 +15,7 @@ Covers:
 
 import json
 import subprocess
+import tarfile
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, call, mock_open, patch
 
@@ -251,13 +252,92 @@ def test_get_docker_volumes_container_not_found(plugin, mock_docker_client):
         assert volumes == []
 
 
+def make_helper_container(chunks, exit_code=0, stderr=b""):
+    """Return a mock volume helper container streaming chunks on stdout."""
+    container = MagicMock()
+    container.attach.return_value = iter(chunks)
+    container.wait.return_value = {"StatusCode": exit_code}
+    container.logs.return_value = stderr
+    return container
+
+
 def test_backup_docker_volume(plugin, mock_docker_client, tmp_path):
-    """Test backing up a Docker volume."""
+    """Test backing up a Docker volume streams the archive to a local file."""
+    container = make_helper_container([b"tar ", b"data"])
+    mock_docker_client.containers.create.return_value = container
+
     with patch.object(plugin, "_get_docker_client", return_value=mock_docker_client):
         result = plugin._backup_docker_volume("data-vol", tmp_path)
 
-        assert result is True
-        assert (tmp_path / "data-vol.tar.gz").exists()
+    assert result is True
+    assert (tmp_path / "data-vol.tar.gz").read_bytes() == b"tar data"
+
+    # Only the volume is mounted; the archive comes back over the API
+    _, kwargs = mock_docker_client.containers.create.call_args
+    assert kwargs["command"][:3] == ["tar", "czf", "-"]
+    assert kwargs["volumes"] == {"data-vol": {"bind": "/volume-data", "mode": "ro"}}
+
+    # Attached before start so no output is missed, then cleaned up
+    assert container.method_calls.index(
+        call.attach(stdout=True, stderr=False, stream=True)
+    ) < container.method_calls.index(call.start())
+    container.remove.assert_called_once_with(force=True)
+
+
+def test_backup_docker_volume_pulls_missing_image(plugin, mock_docker_client, tmp_path):
+    """Test the helper image is pulled when it is not present locally."""
+    import docker
+
+    container = make_helper_container([b"tar data"])
+    mock_docker_client.containers.create.side_effect = [
+        docker.errors.ImageNotFound("no such image"),
+        container,
+    ]
+
+    with patch.object(plugin, "_get_docker_client", return_value=mock_docker_client):
+        result = plugin._backup_docker_volume("data-vol", tmp_path)
+
+    assert result is True
+    mock_docker_client.images.pull.assert_called_once_with(plugin.VOLUME_HELPER_IMAGE)
+
+
+def test_backup_docker_volume_tar_failure_removes_partial(
+    plugin, mock_docker_client, tmp_path
+):
+    """Test a non-zero tar exit fails the backup and drops the partial file."""
+    container = make_helper_container(
+        [b"truncated"], exit_code=2, stderr=b"tar: read error"
+    )
+    mock_docker_client.containers.create.return_value = container
+
+    with patch.object(plugin, "_get_docker_client", return_value=mock_docker_client):
+        result = plugin._backup_docker_volume("data-vol", tmp_path)
+
+    assert result is False
+    assert not (tmp_path / "data-vol.tar.gz").exists()
+    container.remove.assert_called_once_with(force=True)
+
+
+def test_backup_docker_volume_docker_error_removes_partial(
+    plugin, mock_docker_client, tmp_path
+):
+    """Test a Docker error mid-stream does not leave a truncated archive."""
+    import docker
+
+    def broken_stream():
+        yield b"partial"
+        raise docker.errors.APIError("connection reset")
+
+    container = make_helper_container([])
+    container.attach.return_value = broken_stream()
+    mock_docker_client.containers.create.return_value = container
+
+    with patch.object(plugin, "_get_docker_client", return_value=mock_docker_client):
+        result = plugin._backup_docker_volume("data-vol", tmp_path)
+
+    assert result is False
+    assert not (tmp_path / "data-vol.tar.gz").exists()
+    container.remove.assert_called_once_with(force=True)
 
 
 def test_backup_docker_service_success(
@@ -691,6 +771,48 @@ def test_create_tar_archive_success(plugin, tmp_path):
     assert destination.exists()
 
 
+def test_create_tar_archive_uses_large_write_buffer(plugin, tmp_path, monkeypatch):
+    """Test archive output goes through a buffered file of the configured size."""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "file.txt").write_text("test")
+    destination = tmp_path / "backup.tar.gz"
+
+    open_calls = []
+
+    def spy_open(file, mode="r", buffering=-1, **kwargs):
+        open_calls.append((Path(file), mode, buffering))
+        return open(file, mode, buffering, **kwargs)
+
+    monkeypatch.setattr("plugins.services.generic.open", spy_open, raising=False)
+
+    assert plugin._create_tar_archive([source_dir], destination) is True
+    assert open_calls == [
+        (destination, "wb", GenericServicePlugin.ARCHIVE_WRITE_BUFFER_BYTES)
+    ]
+    with tarfile.open(destination, "r:gz") as tar:
+        assert tar.getnames() == ["source", "source/file.txt"]
+
+
+def test_create_tar_archive_uses_large_copy_buffer(plugin, tmp_path, monkeypatch):
+    """Test source files are copied into the archive in large chunks."""
+    source_file = tmp_path / "file.bin"
+    source_file.write_bytes(b"x" * 1024)
+    destination = tmp_path / "backup.tar.gz"
+
+    copy_sizes = []
+    real_copyfileobj = tarfile.copyfileobj
+
+    def spy_copyfileobj(src, dst, length=None, exception=OSError, bufsize=None):
+        copy_sizes.append(bufsize)
+        return real_copyfileobj(src, dst, length, exception, bufsize)
+
+    monkeypatch.setattr(tarfile, "copyfileobj", spy_copyfileobj)
+
+    assert plugin._create_tar_archive([source_file], destination) is True
+    assert copy_sizes == [GenericServicePlugin.ARCHIVE_COPY_BUFFER_BYTES]
+
+
 def test_create_tar_archive_permission_error(plugin, tmp_path):
     """Test tar archive creation with permission error."""
     source_dir = tmp_path / "source"
@@ -7,9 +7,11 @@ Tests cover:
 - Sorting by modification time
 - File vs directory filtering
 - Error handling
+- Lazy iteration via _iter_backup_files
 - Integration with _get_backup_directory
 """
 
+import os
 import time
 from pathlib import Path
 
@@ -68,6 +70,19 @@ def backup_engine_temp(temp_backup_config, tmp_path):
     return BackupEngine(config, state), backup_root
 
 
+class _ListScandir:
+    """Context manager wrapping a pre-read list of os.DirEntry objects."""
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    def __enter__(self):
+        return iter(self.entries)
+
+    def __exit__(self, *args):
+        return False
+
+
 class TestGetBackupFiles:
     """Test BackupEngine._get_backup_files() method."""
 
@@ -390,17 +405,107 @@ class TestGetBackupFiles:
         test_file = backup_dir / "test.tar.gz"
         test_file.touch()
 
-        # Mock iterdir to raise permission error
-        def mock_iterdir(*args):
+        # Mock scandir to raise permission error
+        def mock_scandir(*args):
             raise OSError("Permission denied")
 
-        monkeypatch.setattr(Path, "iterdir", mock_iterdir)
+        monkeypatch.setattr(os, "scandir", mock_scandir)
 
         files = engine._get_backup_files("test")
 
         # Should return empty list on error
         assert files == []
 
+    def test_directory_removed_after_creation_returns_empty_list(
+        self, backup_engine_temp
+    ):
+        """Test that a directory deleted out from under the engine returns []."""
+        engine, backup_root = backup_engine_temp
+
+        backup_dir = engine._get_backup_directory("test")
+        backup_dir.rmdir()
+
+        assert engine._get_backup_files("test") == []
+
+    def test_entries_statted_in_inode_order(self, backup_engine_temp, monkeypatch):
+        """Test that entries are stat'ed in inode order, then sorted by mtime."""
+        engine, backup_root = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+        stat_order = []
+
+        class FakeEntry:
+            def __init__(self, name, ino, mtime):
+                self.name = name
+                self.path = str(backup_dir / name)
+                self._ino = ino
+                self._mtime = mtime
+
+            def is_file(self):
+                return True
+
+            def inode(self):
+                return self._ino
+
+            def stat(self):
+                stat_order.append(self._ino)
+                return os.stat_result((0, self._ino, 0, 0, 0, 0, 0, 0, self._mtime, 0))
+
+        class FakeScandir:
+            def __init__(self, *args):
+                self.entries = [
+                    FakeEntry("c.tar.gz", 30, 1.0),
+                    FakeEntry("a.tar.gz", 10, 3.0),
+                    FakeEntry("b.tar.gz", 20, 2.0),
+                ]
+
+            def __enter__(self):
+                return iter(self.entries)
+
+            def __exit__(self, *args):
+                return False
+
+        monkeypatch.setattr(os, "scandir", FakeScandir)
+
+        files = engine._get_backup_files("test")
+
+        assert stat_order == [10, 20, 30]
+        assert [f.name for f in files] == ["c.tar.gz", "b.tar.gz", "a.tar.gz"]
+
+    def test_file_removed_after_listing_is_skipped(
+        self, backup_engine_temp, monkeypatch
+    ):
+        """Test that a file deleted between scandir and stat is skipped."""
+        engine, backup_root = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+        kept = backup_dir / "kept.tar.gz"
+        kept.write_text("kept")
+        vanished = backup_dir / "vanished.tar.gz"
+        vanished.write_text("vanished")
+
+        real_scandir = os.scandir
+
+        def scandir_then_delete(path):
+            entries = list(real_scandir(path))
+            vanished.unlink()
+            return _ListScandir(entries)
+
+        monkeypatch.setattr(os, "scandir", scandir_then_delete)
+
+        assert engine._get_backup_files("test") == [kept]
+
+    def test_iter_backup_files_is_lazy(self, backup_engine_temp):
+        """Test that _iter_backup_files() yields (path, stat) pairs lazily."""
+        engine, backup_root = backup_engine_temp
+        backup_dir = engine._get_backup_directory("test")
+        (backup_dir / "backup.tar.gz").write_text("content")
+
+        iterator = engine._iter_backup_files("test")
+
+        assert not isinstance(iterator, list)
+        [(path, file_stat)] = list(iterator)
+        assert path == backup_dir / "backup.tar.gz"
+        assert file_stat.st_size == len("content")
+
     def test_returns_newest_last(self, backup_engine_temp):
         """Test that newest file is last in list."""
         engine, backup_root = backup_engine_temp
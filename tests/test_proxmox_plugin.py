@@ -19,13 +19,21 @@ from proxmoxer.core import ResourceException
 
 from core.config_loader import ConfigLoader, ServiceConfig
 from lib.state_manager import StateManager
-from plugins.hypervisors.proxmox import ProxmoxPlugin
+from plugins.hypervisors.proxmox import _API_CLIENT_POOL, ProxmoxPlugin
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def clear_api_client_pool():
+    """Keep pooled API clients (mocks) from leaking between tests."""
+    _API_CLIENT_POOL.clear()
+    yield
+    _API_CLIENT_POOL.clear()
+
+
 @pytest.fixture
 def fixtures_dir():
     """Return path to test fixtures directory."""
@@ -183,6 +191,35 @@ def test_api_client_initialization(plugin, mock_api_client):
         assert client1 is mock_api_client
 
 
+def test_api_client_shared_between_plugins(plugin, config_loader, state_manager):
+    """Test plugins with the same connection settings share one API client."""
+
+    class FakeClient:
+        pass
+
+    client = FakeClient()
+    with patch("plugins.hypervisors.proxmox.ProxmoxAPI", return_value=client) as api:
+        other = ProxmoxPlugin(config=config_loader, state=state_manager)
+
+        assert plugin._get_api_client() is client
+        assert other._get_api_client() is client
+        api.assert_called_once()
+
+
+def test_api_client_pool_drops_unreferenced_clients(plugin):
+    """Test pooled clients are released once no plugin holds them."""
+
+    class FakeClient:
+        pass
+
+    with patch("plugins.hypervisors.proxmox.ProxmoxAPI", new=lambda **_: FakeClient()):
+        plugin._get_api_client()
+
+    assert len(_API_CLIENT_POOL) == 1
+    plugin._api_client = None
+    assert len(_API_CLIENT_POOL) == 0
+
+
 def test_api_client_connection_error(plugin):
     """Test that connection error is handled gracefully."""
     with patch(
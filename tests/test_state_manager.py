@@ -9,14 +9,22 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import sqlite3
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from enum import IntEnum
 from pathlib import Path
 
 import pytest
 
-from lib.state_manager import StateManager
+from lib.state_manager import (
+    _SQL_KEYS_RANGE,
+    StateError,
+    StateManager,
+    _prefix_upper_bound,
+)
 
 
 @pytest.fixture
@@ -60,6 +68,24 @@ class TestInitialization:
         state2 = StateManager(temp_db)
         assert state2.get("key1") == "value1"
 
+    def test_uses_wal_journal(self, temp_db):
+        """Test that the database is switched to WAL journaling."""
+        StateManager(temp_db)
+
+        conn = sqlite3.connect(str(temp_db))
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+
+        assert mode == "wal"
+
+    def test_connections_use_normal_synchronous(self, state_manager):
+        """Test that connections relax fsyncs to synchronous=NORMAL."""
+        with state_manager._get_connection() as conn:
+            # 1 == NORMAL
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
 
 # Test: Basic Operations
 class TestBasicOperations:
@@ -133,6 +159,30 @@ class TestBasicOperations:
         state_manager.set("test.key", "value2")
         assert state_manager.get("test.key") == "value2"
 
+    def test_set_many(self, state_manager):
+        """Test setting several keys at once."""
+        state_manager.set("test.old", "value")
+
+        state_manager.set_many({"test.old": None, "test.count": 3, "test.name": "x"})
+
+        assert state_manager.get_all() == {
+            "test.old": None,
+            "test.count": 3,
+            "test.name": "x",
+        }
+
+    def test_set_many_unsupported_type_writes_nothing(self, state_manager):
+        """Test a bad value in set_many fails before any key is written."""
+
+        class CustomClass:
+            pass
+
+        with pytest.raises(TypeError) as exc_info:
+            state_manager.set_many({"test.ok": 1, "test.custom": CustomClass()})
+
+        assert "Unsupported type" in str(exc_info.value)
+        assert state_manager.exists("test.ok") is False
+
     def test_delete_existing_key(self, state_manager):
         """Test deleting an existing key."""
         state_manager.set("test.key", "value")
@@ -228,6 +278,40 @@ class TestGetKeys:
 
         assert keys == []
 
+    def test_get_keys_prefix_is_literal(self, state_manager):
+        """Test that LIKE wildcards and case differences do not match."""
+        state_manager.set("backup_status.plex", "value1")
+        state_manager.set("backupXstatus.plex", "value2")
+        state_manager.set("BACKUP_STATUS.nginx", "value3")
+
+        assert state_manager.get_keys("backup_status.") == ["backup_status.plex"]
+
+    def test_get_keys_prefix_uses_key_index(self, state_manager):
+        """Test that prefix lookups search the primary key index."""
+        state_manager.set("backup.plex", "value1")
+        upper = _prefix_upper_bound("backup.")
+
+        with state_manager._get_connection() as conn:
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN {_SQL_KEYS_RANGE}", ("backup.", upper)
+            ).fetchall()
+
+        assert "SEARCH" in plan[0][-1]
+
+    def test_prefix_upper_bound(self):
+        """Test the exclusive upper bound used for prefix range scans."""
+        assert _prefix_upper_bound("backup.") == "backup/"
+        assert _prefix_upper_bound("a\U0010ffff") == "b"
+        assert _prefix_upper_bound("\ud7ff") == "\ue000"
+        assert _prefix_upper_bound("\U0010ffff") is None
+
+    def test_get_keys_prefix_of_maximal_code_points(self, state_manager):
+        """Test a prefix with no upper bound still filters correctly."""
+        state_manager.set("\U0010ffff.key", "value1")
+        state_manager.set("other.key", "value2")
+
+        assert state_manager.get_keys("\U0010ffff") == ["\U0010ffff.key"]
+
 
 # Test: Thread Safety
 class TestThreadSafety:
@@ -311,6 +395,18 @@ class TestEdgeCases:
         state_manager.set("test.unicode", unicode_value)
         assert state_manager.get("test.unicode") == unicode_value
 
+    def test_subclasses_of_supported_types(self, state_manager):
+        """Test that subclasses are stored like their base type."""
+
+        class Level(IntEnum):
+            HIGH = 3
+
+        state_manager.set("test.level", Level.HIGH)
+        state_manager.set("test.ordered", OrderedDict(b=1, a=2))
+
+        assert state_manager.get("test.level") == 3
+        assert state_manager.get("test.ordered") == {"b": 1, "a": 2}
+
     def test_complex_nested_dict(self, state_manager):
         """Test deeply nested dictionary."""
         complex_data = {
@@ -330,6 +426,21 @@ class TestEdgeCases:
 
         assert "Unsupported type" in str(exc_info.value)
 
+    def test_unknown_stored_type_raises_state_error(self, state_manager, temp_db):
+        """Test that a row with an unrecognized type tag fails loudly."""
+        conn = sqlite3.connect(str(temp_db))
+        try:
+            conn.execute(
+                "INSERT INTO state (key, value, type) VALUES (?, ?, ?)",
+                ("test.bad", "x", "complex"),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        with pytest.raises(StateError, match="Unknown type in database: complex"):
+            state_manager.get("test.bad")
+
 
 # Test: Persistence
 class TestPersistence:
@@ -358,3 +469,78 @@ class TestPersistence:
 
         state2.set("shared.key", "value2")
         assert state1.get("shared.key") == "value2"
+
+
+# Test: Connection Lifecycle
+class TestConnection:
+    """Test the long-lived database connection."""
+
+    def test_connection_reused_across_calls(self, state_manager):
+        """Test that operations share one connection instead of reconnecting."""
+        with state_manager._get_connection() as first:
+            pass
+
+        state_manager.set("conn.key", "value")
+        state_manager.get("conn.key")
+
+        with state_manager._get_connection() as second:
+            assert second is first
+
+    def test_connection_usable_from_other_threads(self, state_manager):
+        """Test that the shared connection works outside the creating thread."""
+        errors = []
+
+        def worker():
+            try:
+                state_manager.set("thread.key", "value")
+            except Exception as e:
+                errors.append(e)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+        assert errors == []
+        assert state_manager.get("thread.key") == "value"
+
+    def test_close_is_idempotent_and_blocks_further_use(self, state_manager):
+        """Test that close() can be repeated and later calls raise StateError."""
+        state_manager.close()
+        state_manager.close()
+
+        with pytest.raises(StateError, match="closed"):
+            state_manager.get("any.key")
+
+    def test_context_manager_closes_connection(self, temp_db):
+        """Test that leaving a with block closes the connection."""
+        with StateManager(temp_db) as state:
+            state.set("ctx.key", "value")
+
+        with pytest.raises(StateError):
+            state.set("ctx.key", "other")
+
+        with StateManager(temp_db) as state:
+            assert state.get("ctx.key") == "value"
+
+    def test_recovers_after_write_fails_on_locked_database(self, temp_db):
+        """Test that a failed write does not leave the connection stuck."""
+        state = StateManager(temp_db, timeout=0.1)
+        state.set("lock.key", "before")
+
+        other = sqlite3.connect(str(temp_db), isolation_level=None)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            with pytest.raises(StateError, match="database is locked"):
+                state.set("lock.key", "blocked")
+            other.execute("ROLLBACK")
+
+            # A read here would pin a snapshot if the failed write had left
+            # the connection inside its transaction
+            assert state.get("lock.key") == "before"
+            other.execute("UPDATE state SET value = 'external' WHERE key = 'lock.key'")
+        finally:
+            other.close()
+
+        assert state.get("lock.key") == "external"
+        state.set("lock.key", "after")
+        assert state.get("lock.key") == "after"
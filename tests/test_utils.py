@@ -36,6 +36,10 @@ class TestValidatePath:
         assert isinstance(result, Path)
         assert result == tmp_path
 
+    def test_path_object_returned_without_copy(self, tmp_path):
+        """Test that a Path argument is returned as-is, not rebuilt."""
+        assert validate_path(tmp_path) is tmp_path
+
     def test_empty_path_raises_error(self):
         """Test that empty path raises ValueError."""
         with pytest.raises(ValueError, match="Path cannot be empty"):
@@ -234,6 +238,25 @@ class TestFormatBytes:
         """Test custom precision."""
         assert format_bytes(1536, precision=1) == "1.5 KB"
 
+    def test_unit_boundaries(self):
+        """Test values on either side of each 1024 step."""
+        assert format_bytes(1023) == "1023.00 B"
+        assert format_bytes(1024) == "1.00 KB"
+        assert format_bytes(1023.5) == "1023.50 B"
+        assert format_bytes(1024.5) == "1.00 KB"
+
+    def test_caps_at_petabytes(self):
+        """Test sizes beyond the largest unit stay in PB."""
+        assert format_bytes(1024**6) == "1024.00 PB"
+
+    def test_infinity(self):
+        """Test infinite sizes are formatted in the largest unit."""
+        assert format_bytes(float("inf")) == "inf PB"
+
+    def test_nan(self):
+        """Test NaN is formatted without a unit conversion."""
+        assert format_bytes(float("nan")) == "nan B"
+
 
 class TestSanitizeFilename:
     """Tests for sanitize_filename function."""
@@ -259,6 +282,14 @@ class TestSanitizeFilename:
         """Test custom replacement character."""
         assert sanitize_filename("my:file.txt", replacement="-") == "my-file.txt"
 
+    def test_replaces_control_and_backslash_characters(self):
+        """Test ASCII control characters and backslashes are replaced."""
+        assert sanitize_filename("a\x00b\tc\x1fd\\e\x7f") == "a_b_c_d_e\x7f"
+
+    def test_multi_character_replacement(self):
+        """Test replacement strings longer than one character."""
+        assert sanitize_filename("a<b>c", replacement="--") == "a--b--c"
+
 
 # Validator Tests
 